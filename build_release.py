@@ -4,71 +4,123 @@ Build script for flacterm distribution packages.
 This script builds source and wheel distributions for PyPI upload.
 """
 
+import importlib.util
 import os
 import sys
+import shlex
 import shutil
 import subprocess
 import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 def run_command(cmd, cwd=None):
-    """Run a command and return the result."""
-    print(f"Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"Error running command: {cmd}")
-        print(f"stdout: {result.stdout}")
-        print(f"stderr: {result.stderr}")
+    """Run a command, streaming its output, and return the last lines printed.
+
+    The command is executed directly rather than through a shell, so no
+    extra /bin/sh process is spawned per step. Only a bounded tail of the
+    output is kept in memory for error reporting.
+    """
+    args = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
+    print(f"Running: {shlex.join(args)}")
+    tail = deque(maxlen=200)
+    with subprocess.Popen(
+        args, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        text=True, bufsize=1
+    ) as proc:
+        for line in proc.stdout:
+            print(line, end="")
+            tail.append(line)
+        returncode = proc.wait()
+
+    if returncode != 0:
+        print(f"Error running command: {shlex.join(args)}")
+        print("Last output:")
+        print("".join(tail), end="")
         sys.exit(1)
-    return result.stdout.strip()
+    return "".join(tail).strip()
 
 def clean_build_directories():
     """Clean build directories."""
     print("Cleaning build directories...")
-    dirs_to_clean = ['build', 'dist', '*.egg-info']
-    for dir_pattern in dirs_to_clean:
-        if '*' in dir_pattern:
-            # Handle glob patterns
-            import glob
-            for path in glob.glob(dir_pattern):
-                if os.path.exists(path):
-                    shutil.rmtree(path)
-                    print(f"Removed: {path}")
-        else:
-            if os.path.exists(dir_pattern):
-                shutil.rmtree(dir_pattern)
-                print(f"Removed: {dir_pattern}")
+    with os.scandir('.') as entries:
+        paths = [
+            entry.path for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+            and (entry.name in ('build', 'dist') or entry.name.endswith('.egg-info'))
+        ]
+
+    # Remove the trees concurrently; rmtree is dominated by per-file syscalls
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        for path, _ in zip(paths, executor.map(shutil.rmtree, paths)):
+            print(f"Removed: {path}")
 
 def check_dependencies():
     """Check if required build dependencies are installed."""
     print("Checking build dependencies...")
     required_packages = ['setuptools', 'wheel', 'build']
 
+    # find_spec only probes sys.path, so nothing gets imported just to check
+    missing = []
     for package in required_packages:
-        try:
-            __import__(package)
-            print(f"✓ {package} is installed")
-        except ImportError:
+        if importlib.util.find_spec(package) is None:
             print(f"✗ {package} is not installed")
-            print(f"Installing {package}...")
-            run_command(f"{sys.executable} -m pip install {package}")
+            missing.append(package)
+        else:
+            print(f"✓ {package} is installed")
+
+    if missing:
+        print(f"Installing {', '.join(missing)}...")
+        run_command([sys.executable, "-m", "pip", "install", *missing])
 
-def build_source_distribution():
+def _egg_info_args(egg_base):
+    """Return setup.py arguments that write egg-info under its own directory."""
+    if not egg_base:
+        return []
+    os.makedirs(egg_base, exist_ok=True)
+    return ["egg_info", "--egg-base", egg_base]
+
+def build_source_distribution(egg_base=None):
     """Build source distribution."""
     print("Building source distribution...")
-    run_command(f"{sys.executable} setup.py sdist")
+    run_command([sys.executable, "setup.py", *_egg_info_args(egg_base), "sdist"])
     print("✓ Source distribution built")
 
-def build_wheel_distribution():
+def build_wheel_distribution(egg_base=None):
     """Build wheel distribution."""
     print("Building wheel distribution...")
-    run_command(f"{sys.executable} setup.py bdist_wheel")
+    run_command([sys.executable, "setup.py", *_egg_info_args(egg_base), "bdist_wheel"])
     print("✓ Wheel distribution built")
 
+def build_with_setuptools():
+    """Build sdist and wheel concurrently with setuptools.
+
+    The two builds are independent, so they run side by side. Each gets its
+    own egg-info directory so they don't race on the shared metadata.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(build_source_distribution, os.path.join("build", "egg-sdist")),
+            executor.submit(build_wheel_distribution, os.path.join("build", "egg-wheel")),
+        ]
+        for future in as_completed(futures):
+            future.result()
+
 def build_with_build_module():
     """Build using the modern build module."""
     print("Building with python -m build...")
-    run_command(f"{sys.executable} -m build")
+    try:
+        from build.__main__ import main as build_main
+    except ImportError:
+        run_command([sys.executable, "-m", "build"])
+    else:
+        # Run the build frontend in-process instead of starting a new interpreter
+        try:
+            build_main([])
+        except SystemExit as e:
+            if e.code:
+                raise RuntimeError(f"build exited with status {e.code}") from e
     print("✓ Distributions built with build module")
 
 def verify_distributions():
@@ -100,6 +152,27 @@ def verify_distributions():
         print("✗ Missing distribution type")
         return False
 
+def write_if_changed(path, content, mode=None):
+    """Write content to path only if it differs from what is on disk.
+
+    Leaving unchanged files untouched keeps their mtime stable, so caches
+    keyed on these files stay valid across no-op rebuilds.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    data = content.encode('utf-8')
+    target = Path(path)
+    if target.exists() and target.read_bytes() == data:
+        return False
+
+    tmp = target.with_name(target.name + '.tmp')
+    tmp.write_bytes(data)
+    if mode is not None:
+        os.chmod(tmp, mode)
+    os.replace(tmp, target)
+    return True
+
 def create_installation_scripts():
     """Create installation scripts."""
     print("Creating installation scripts...")
@@ -150,11 +223,10 @@ echo "Installation complete!"
 echo "Run 'flacterm' to start the application"
 '''
 
-    with open('install.sh', 'w') as f:
-        f.write(install_sh_content)
-
-    os.chmod('install.sh', 0o755)
-    print("✓ Created install.sh")
+    if write_if_changed('install.sh', install_sh_content, mode=0o755):
+        print("✓ Updated install.sh")
+    else:
+        print("✓ install.sh unchanged")
 
     # Create requirements-dev.txt for development
     dev_requirements = '''# Development requirements
@@ -168,10 +240,10 @@ flake8
 mypy
 '''
 
-    with open('requirements-dev.txt', 'w') as f:
-        f.write(dev_requirements)
-
-    print("✓ Created requirements-dev.txt")
+    if write_if_changed('requirements-dev.txt', dev_requirements):
+        print("✓ Updated requirements-dev.txt")
+    else:
+        print("✓ requirements-dev.txt unchanged")
 
 def main():
     """Main build process."""
@@ -198,8 +270,7 @@ def main():
         build_with_build_module()
     except:
         print("Modern build failed, falling back to setuptools...")
-        build_source_distribution()
-        build_wheel_distribution()
+        build_with_setuptools()
 
     # Verify distributions
     if verify_distributions():
@@ -2,7 +2,6 @@
 Audio playback functionality using VLC.
 """
 import vlc
-import time
 import threading
 from ..config import console
 
@@ -20,7 +19,13 @@ class AudioPlayer:
         self._position_callback = None
         self._on_end_callback = None
         self._update_thread = None
-        self._running = False
+        # Wakes the position thread early on resume or stop; while paused it sleeps on this
+        self._wake = threading.Event()
+        # play() and stop() can be called from different threads, so state changes are
+        # serialized, and each play gets its own stop event so a stopped play or
+        # position thread can never carry on into the next track
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
 
     def play(self, url):
         """
@@ -30,28 +35,36 @@ class AudioPlayer:
             url: Audio stream URL
         """
         self.stop()
-        self.media = self.instance.media_new(url)
-        self.player.set_media(self.media)
-        self.player.play()
+        with self._lock:
+            stop_event = self._stop_event = threading.Event()
+            self.media = self.instance.media_new(url)
+            self.player.set_media(self.media)
+            self.player.play()
 
-        self.is_playing = True
-        self.is_paused = False
+            self.is_playing = True
+            self.is_paused = False
 
-        # Wait until VLC reports it's playing
+        # Wait until VLC reports it's playing, giving up early if stopped meanwhile
         max_tries = 30
         for _ in range(max_tries):
             state = self.player.get_state()
             if state == vlc.State.Playing:
                 break
-            time.sleep(0.1)
-
-        self._running = True
-        self._update_thread = threading.Thread(target=self._update_position, daemon=True)
-        self._update_thread.start()
-
-    def _update_position(self):
+            if stop_event.wait(0.1):
+                return
+
+        with self._lock:
+            if stop_event.is_set():
+                return
+            self._wake.clear()
+            self._update_thread = threading.Thread(
+                target=self._update_position, args=(stop_event,), daemon=True
+            )
+            self._update_thread.start()
+
+    def _update_position(self, stop_event):
         """Thread that updates the position and checks for track end."""
-        while self._running and self.is_playing:
+        while not stop_event.is_set() and self.is_playing:
             if not self.is_paused and self.player.is_playing():
                 # Get current position and duration in milliseconds
                 position_ms = self.player.get_time()
@@ -71,15 +84,16 @@ class AudioPlayer:
                 # Check if track has ended
                 state = self.player.get_state()
                 if state == vlc.State.Ended or (duration_ms > 0 and position_ms >= duration_ms - 500):
-                    if self._on_end_callback:
+                    if self._on_end_callback and not stop_event.is_set():
                         try:
                             self._on_end_callback()
                         except Exception as e:
                             console.print(f"Error in end callback: {e}")
                     break
 
-            # Sleep briefly to avoid consuming too much CPU
-            time.sleep(0.25)
+            # Sleep until the next tick, or while paused until resumed or stopped
+            self._wake.wait(None if self.is_paused else 0.25)
+            self._wake.clear()
 
     def set_position_callback(self, callback):
         """
@@ -101,15 +115,18 @@ class AudioPlayer:
 
     def pause(self):
         """Pause playback."""
-        if self.is_playing and not self.is_paused:
-            self.player.pause()
-            self.is_paused = True
+        with self._lock:
+            if self.is_playing and not self.is_paused:
+                self.player.pause()
+                self.is_paused = True
 
     def resume(self):
         """Resume playback after pause."""
-        if self.is_playing and self.is_paused:
-            self.player.play()
-            self.is_paused = False
+        with self._lock:
+            if self.is_playing and self.is_paused:
+                self.player.play()
+                self.is_paused = False
+                self._wake.set()
 
     def toggle_pause(self):
         """Toggle between play and pause."""
@@ -120,18 +137,25 @@ class AudioPlayer:
 
     def stop(self):
         """Stop playback completely."""
-        # Signal thread to stop
-        self._running = False
-
-        # Stop the player
-        if self.is_playing:
-            self.player.stop()
-            self.is_playing = False
-            self.is_paused = False
+        with self._lock:
+            # Signal thread to stop
+            self._stop_event.set()
+            self._wake.set()
+
+            # Stop the player
+            if self.is_playing:
+                self.player.stop()
+                self.is_playing = False
+                self.is_paused = False
+            update_thread = self._update_thread
 
         # Wait for thread to terminate
-        if self._update_thread and self._update_thread.is_alive():
-            self._update_thread.join(timeout=1.0)
+        if (
+            update_thread
+            and update_thread is not threading.current_thread()
+            and update_thread.is_alive()
+        ):
+            update_thread.join(timeout=1.0)
 
     def get_current_time(self):
         """
@@ -1,45 +1,83 @@
 """
 Component to display keyboard shortcuts help.
 """
+from rich.console import Group
 from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
 from textual.widgets import Static
 
+# Keybinding rows per help profile as (key, description) pairs
+_PROFILES = {
+    "default": (
+        ("h", "Show/hide this help screen"),
+        ("l", "Toggle lyrics"),
+        ("space", "Play/pause"),
+        ("->", "Next page"),
+        ("<-", "Previous page"),
+        ("q", "Quit"),
+        ("s", "Show track info"),
+        ("/", "Start a new search"),
+        ("Esc", "Stop playback"),
+        ("b", "Fast forward 5 seconds"),
+        ("v", "Rewind 5 seconds"),
+        ("Enter", "Submit new search"),
+        ("r", "Toggle repeat mode"),
+        ("a", "Add current track to queue"),
+        ("y", "Remove track from queue"),
+        ("t", "Show/hide queue display"),
+        ("c", "Clear queue"),
+        ("m", "Show playlists"),
+        ("d", "Download hovered track"),
+        ("k", "Play from queue"),
+        ("e", "Return to normal results"),
+        ("^a", "Add hovered song to playlist"),
+        ("^r", "Remove hovered song from playlist"),
+        ("R", "Clear cached searches and lyrics"),
+    ),
+}
+
+def _build_table(rows) -> Table:
+    """Build a two-column grid of keybindings."""
+    table = Table.grid(padding=(0, 2))
+    table.add_column(style="bold")
+    table.add_column()
+    for key, desc in rows:
+        table.add_row(Text(key), Text(desc))
+    return table
+
+# The help text never changes, so build each profile's panel once at import
+_KEYBINDS_TEXT = {
+    name: "Available Keybindings:\n\n"
+    + "\n".join(f"{key:<5} {desc}" for key, desc in rows)
+    for name, rows in _PROFILES.items()
+}
+_KEYBINDS_PANEL = {
+    name: Panel(
+        Group(Text("Available Keybindings:", style="bold"), Text(""), _build_table(rows)),
+        title="Keybindings",
+        border_style="cyan",
+    )
+    for name, rows in _PROFILES.items()
+}
+
 class KeybindsDisplay(Static):
     """Widget for displaying keyboard shortcuts help."""
+
+    def __init__(self, *args, profile: str = "default", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.profile = profile if profile in _PROFILES else "default"
     
     def get_keybinds_text(self) -> str:
         """
         Get the text describing all available keybindings.
+
+        Kept for callers that want plain text; rendering uses a prebuilt table.
         
         Returns:
-            Formatted keybindings text
+            Plain keybindings text
         """
-        return (
-            "[b]Available Keybindings:[/b]\n\n"
-            "h     Show/hide this help screen\n"
-            "l     Toggle lyrics\n"
-            "space Play/pause\n"
-            "->    Next page\n"
-            "<-    Previous page\n"
-            "q     Quit\n"
-            "s     Show track info\n"
-            "/     Start a new search\n"
-            "Esc   Stop playback\n"
-            "b     Fast forward 5 seconds\n"
-            "v     Rewind 5 seconds\n"
-            "Enter Submit new search\n"
-            "r     Toggle repeat mode\n"
-            "a     Add current track to queue\n"
-            "y     Remove track from queue\n"
-            "t     Show/hide queue display\n"
-            "c     Clear queue\n"
-            "m     Show playlists\n"
-            "d     Download hovered track\n"
-            "k	   Play from queue\n"
-            "e     Return to normal results\n"
-            "^a    Add hovered song to playlist\n"
-            "^r    Remove hovered song from playlist\n"
-        )
+        return _KEYBINDS_TEXT[self.profile]
 
     def render(self):
         """
@@ -48,4 +86,4 @@ class KeybindsDisplay(Static):
         Returns:
             Rich Panel with keybindings
         """
-        return Panel(self.get_keybinds_text(), title="Keybindings", border_style="cyan")
+        return _KEYBINDS_PANEL[self.profile]
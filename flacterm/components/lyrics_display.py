@@ -1,11 +1,116 @@
 """
 Lyrics display component for showing synchronized lyrics.
 """
+import asyncio
 import re
+from bisect import bisect_right
+import string
+import threading
 from textual.widget import Widget
 from textual.widgets import Static
 from textual.containers import ScrollableContainer
 from ..config import console
+from ..utils.api import memoize
+
+try:
+    from lrclib import LrcLibAPI
+except ImportError:
+    LrcLibAPI = None
+
+# Lyrics don't change, but entries are dropped after a while so fixes upstream show up
+LYRICS_CACHE_TTL = 1800
+# Lyrics are also kept on disk between sessions, for 30 days
+LYRICS_DISK_TTL = 30 * 86400
+
+_LRC_LINE = re.compile(r"\[([0-9]+):([0-9]+\.[0-9]+)\](.*)")
+
+# Used to fold artist and title into cache keys, so near-identical spellings share an entry
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+_WHITESPACE = re.compile(r"\s+")
+
+_api = None
+
+# Caps on simultaneous LRCLIB lookups, to stay clear of its rate limits.
+# Prefetches take a slot from both, so they never use more than two of the five.
+_lookup_slots = threading.BoundedSemaphore(5)
+_prefetch_slots = threading.BoundedSemaphore(2)
+
+
+def _get_api():
+    """Create the LRCLIB client on first use."""
+    global _api
+    if _api is None:
+        _api = LrcLibAPI(user_agent="music-player/1.0.0")
+    return _api
+
+
+def _normalize(text: str) -> str:
+    """Lower-case text and drop punctuation and repeated whitespace."""
+    return _WHITESPACE.sub(" ", text.translate(_PUNCTUATION_TABLE).lower()).strip()
+
+
+def parse_lrc(raw_lyrics: str):
+    """
+    Parse LRC format lyrics into a sorted list of (timestamp, text) pairs.
+
+    Args:
+        raw_lyrics: Raw LRC format lyrics text
+    """
+    lines = []
+    for line in raw_lyrics.splitlines():
+        match = _LRC_LINE.match(line)
+        if match:
+            min_str, sec_str, text = match.groups()
+            lines.append((int(min_str) * 60 + float(sec_str), text.strip()))
+    lines.sort()
+    return lines
+
+
+@memoize(
+    maxsize=256,
+    ttl=LYRICS_CACHE_TTL,
+    key=lambda artist, title, album, duration: (_normalize(artist), _normalize(title), album, duration),
+    persist=True,
+    persist_ttl=LYRICS_DISK_TTL,
+    stale_while_revalidate=True,
+)
+def _cached_lyrics(artist, title, album, duration):
+    """
+    Fetch and parse the lyrics for a track from LRCLIB.
+
+    Returns:
+        List of (timestamp, text) pairs, empty if no lyrics were found
+    """
+    # Nothing to search by; empty results aren't cached either
+    if not artist or not title:
+        return []
+    api = _get_api()
+    with _lookup_slots:
+        if album or duration:
+            lyrics_result = api.get_lyrics(track_name=title, artist_name=artist, album_name=album, duration=duration)
+        else:
+            results = api.search_lyrics(track_name=title, artist_name=artist)
+            if not results:
+                return []
+            lyrics_result = api.get_lyrics_by_id(results[0].id)
+    raw_lyrics = lyrics_result.synced_lyrics or lyrics_result.plain_lyrics
+    return parse_lrc(raw_lyrics) if raw_lyrics else []
+
+
+def prefetch_lyrics(artist, title):
+    """
+    Warm the lyrics cache for a track, ignoring failures.
+
+    Blocks on the network, so call it from a worker thread.
+    """
+    if LrcLibAPI is None or not artist or not title:
+        return
+    try:
+        with _prefetch_slots:
+            _cached_lyrics(artist, title, None, None)
+    except Exception as e:
+        console.print(f"Error prefetching lyrics: {e}")
+
 
 class LyricsDisplay(Widget):
     """Widget for displaying synchronized lyrics."""
@@ -21,18 +126,23 @@ class LyricsDisplay(Widget):
         self.has_lyrics = False
         self.lyrics_lines = []
         self.line_widgets = []
+        # Start time of each line in line_widgets, for finding the current line by bisection
+        self.line_timestamps = []
         self.current_line_index = -1
 
         self.scroll.mount(Static("Waiting for lyrics...", id="lyrics_placeholder"))
 
-        try:
-            from lrclib import LrcLibAPI
-            self.api = LrcLibAPI(user_agent="music-player/1.0.0")
+        if LrcLibAPI is not None:
+            self.api = _get_api()
             self.lrclib_available = True
-        except ImportError:
+        else:
             console.print("lrclib package not found. Please install it with: pip install lrclibapi")
             self.lrclib_available = False
 
+    def on_unmount(self):
+        """Drop cached lyrics along with the widget."""
+        _cached_lyrics.cache_clear()
+
     def parse_lyrics(self, raw_lyrics: str):
         """
         Parse LRC format lyrics.
@@ -40,26 +150,17 @@ class LyricsDisplay(Widget):
         Args:
             raw_lyrics: Raw LRC format lyrics text
         """
-        self.lyrics_lines = []
-        for line in raw_lyrics.splitlines():
-            match = re.match(r"\[([0-9]+):([0-9]+\.[0-9]+)\](.*)", line)
-            if match:
-                min_str, sec_str, text = match.groups()
-                timestamp = int(min_str) * 60 + float(sec_str)
-                self.lyrics_lines.append((timestamp, text.strip()))
-
-        if not self.lyrics_lines:
-            self.has_lyrics = False
-        else:
-            self.lyrics_lines.sort()
-            self.has_lyrics = True
+        self.lyrics_lines = parse_lrc(raw_lyrics)
+        self.has_lyrics = bool(self.lyrics_lines)
 
     def update_content(self):
         """Update the lyrics content in the UI."""
         self.scroll.remove_children()
         self.line_widgets = []
+        self.line_timestamps = []
 
         if self.has_lyrics and self.lyrics_lines:
+            self.line_timestamps = [timestamp for timestamp, _ in self.lyrics_lines]
             for _, text in self.lyrics_lines:
                 widget = Static(text)
                 self.scroll.mount(widget)
@@ -69,23 +170,28 @@ class LyricsDisplay(Widget):
             self.scroll.mount(Static("Lyrics not found."))
             self.scroll.refresh()
 
-    def fetch_lyrics(self, artist, title, album=None, duration=None):
+    def clear_lyrics(self):
+        """Drop the current lyrics and show that none were found."""
+        self.has_lyrics = False
+        self.lyrics_lines = []
+        self.update_content()
+
+    async def fetch_lyrics_async(self, artist, title, album=None, duration=None, executor=None):
         """
-        Fetch lyrics for a track.
+        Fetch lyrics for a track, doing the LRCLIB lookup on a worker thread.
 
         Args:
             artist: Artist name
             title: Track title
             album: Album name (optional)
             duration: Track duration in seconds (optional)
+            executor: Executor to run the lookup in (optional, defaults to the loop's)
 
         Returns:
             True if lyrics were found, False otherwise
         """
         if not artist or not title:
-            self.has_lyrics = False
-            self.lyrics_lines = []
-            self.update_content()
+            self.clear_lyrics()
             return False
 
         if not self.lrclib_available:
@@ -99,19 +205,13 @@ class LyricsDisplay(Widget):
             self.scroll.mount(Static(f"Fetching lyrics for '{title}' by '{artist}'..."))
             self.scroll.refresh()
 
-            if album or duration:
-                lyrics_result = self.api.get_lyrics(track_name=title, artist_name=artist, album_name=album, duration=duration)
-                raw_lyrics = lyrics_result.synced_lyrics or lyrics_result.plain_lyrics
-            else:
-                results = self.api.search_lyrics(track_name=title, artist_name=artist)
-                if results:
-                    lyrics_result = self.api.get_lyrics_by_id(results[0].id)
-                    raw_lyrics = lyrics_result.synced_lyrics or lyrics_result.plain_lyrics
-                else:
-                    raw_lyrics = None
+            # Repeat views of a track are served from memory
+            loop = asyncio.get_event_loop()
+            lyrics_lines = await loop.run_in_executor(executor, _cached_lyrics, artist, title, album, duration)
 
-            if raw_lyrics:
-                self.parse_lyrics(raw_lyrics)
+            if lyrics_lines:
+                self.lyrics_lines = lyrics_lines
+                self.has_lyrics = True
                 self.update_content()
                 self.current_line_index = -1
                 return True
@@ -284,29 +384,25 @@ class LyricsDisplay(Widget):
             return
 
         # Find the last lyric line that should be shown for the current time
-        index = -1
-        for i, (timestamp, _) in enumerate(self.lyrics_lines):
-            if position_seconds >= timestamp:
-                index = i
-            else:
-                break
+        index = bisect_right(self.line_timestamps, position_seconds) - 1
 
         # Avoid unnecessary updates
-        if index == self.current_line_index or index == -1:
+        if index == self.current_line_index or not 0 <= index < len(self.line_widgets):
             return
 
+        # Only the previous and new current lines change style
+        previous = self.current_line_index
         self.current_line_index = index
+        if 0 <= previous < len(self.line_widgets):
+            widget = self.line_widgets[previous]
+            widget.update(self.lyrics_lines[previous][1])
+            widget.styles.color = None
+            widget.styles.bold = False
 
-        # Update styles for all lines
-        for i, widget in enumerate(self.line_widgets):
-            if i == index:
-                widget.update(f"→ {self.lyrics_lines[i][1]}")
-                widget.styles.color = "yellow"
-                widget.styles.bold = True
-            else:
-                widget.update(self.lyrics_lines[i][1])
-                widget.styles.color = None
-                widget.styles.bold = False
+        widget = self.line_widgets[index]
+        widget.update(f"→ {self.lyrics_lines[index][1]}")
+        widget.styles.color = "yellow"
+        widget.styles.bold = True
 
         # Scroll to the current line
-        self.scroll.scroll_to_widget(self.line_widgets[index], animate=False)
+        self.scroll.scroll_to_widget(widget, animate=False)
@@ -2,17 +2,12 @@ from textual.app import ComposeResult
 from textual.widgets import Static, Input, Button, DataTable, Label
 from textual.containers import Vertical, Horizontal, ScrollableContainer
 from textual.reactive import reactive
-from textual.message import Message
 from textual.widget import Widget
+from textual.coordinate import Coordinate
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
-
-class PlaylistSelected(Message):
-    """Message sent when a playlist is selected for adding a track."""
-    def __init__(self, playlist: str) -> None:
-        self.playlist = playlist
-        super().__init__()
+from .playlist_manager import get_duration_str
 
 class PlaylistDisplay(Widget):
     """Widget for displaying and managing playlists."""
@@ -23,6 +18,13 @@ class PlaylistDisplay(Widget):
         self.selected_playlist = None
         self.viewing_playlist_tracks = False
         self.current_playlist_tracks = []
+        self._refresh_pending = False
+        self._rendered_version = None
+        self._columns = ()
+        self._row_snapshot = []
+        self._row_keys = []
+        self._select_timer = None
+        self._pending_row = None
     
     def compose(self) -> ComposeResult:
         with ScrollableContainer():
@@ -48,7 +50,8 @@ class PlaylistDisplay(Widget):
                 
                 # Action buttons
                 with Horizontal(id="playlist-actions"):
-                    yield Button("Back to Playlists", id="back-to-playlists-btn", classes="hidden")
+                    self.back_button = Button("Back to Playlists", id="back-to-playlists-btn", classes="hidden")
+                    yield self.back_button
                     yield Button("Delete Selected", id="delete-playlist-btn", variant="error")
                     yield Button("Rename", id="rename-playlist-btn")
                     yield Button("Clear Playlist", id="clear-playlist-btn", variant="warning")
@@ -67,75 +70,153 @@ class PlaylistDisplay(Widget):
         self.selected_playlist = None
         self.current_playlist_tracks = []
         
-        # Update table
-        self.content_table.clear(columns=True)
-        self.content_table.add_columns("Playlist Name", "Track Count", "Actions")
-        
         playlists = self.playlist_manager.get_playlist_names()
         if not playlists:
-            self.content_table.add_row("No playlists created", "0", "Create one above")
+            rows = [("No playlists created", "0", "Create one above")]
         else:
-            for playlist_name in playlists:
-                track_count = self.playlist_manager.get_playlist_count(playlist_name)
-                self.content_table.add_row(
+            rows = [
+                (
                     playlist_name,
-                    str(track_count),
-                    "Select to view tracks"
+                    str(self.playlist_manager.get_playlist_count(playlist_name)),
+                    "Select to view tracks",
                 )
+                for playlist_name in playlists
+            ]
+        self._set_rows(("Playlist Name", "Track Count", "Actions"), rows)
         
         # Update UI state
-        self.query_one("#back-to-playlists-btn").add_class("hidden")
+        self._rendered_version = self.playlist_manager.version
+        self.back_button.add_class("hidden")
         self.status_label.update(f"Total playlists: {len(playlists)}")
     
+    def _set_rows(self, columns: tuple, rows: list):
+        """
+        Show rows in the content table, patching only what changed.
+
+        When the columns match the previous render, cells are diffed against
+        the last snapshot so only changed cells and the length delta touch the
+        table. Otherwise the table is rebuilt in a single batch.
+
+        Args:
+            columns: Column labels for the table
+            rows: Row tuples to display
+        """
+        table = self.content_table
+        with self.app.batch_update():
+            if columns != self._columns:
+                table.clear(columns=True)
+                table.add_columns(*columns)
+                self._columns = columns
+                self._row_snapshot = []
+                self._row_keys = []
+
+            old_rows = self._row_snapshot
+            for row_index, (old_row, new_row) in enumerate(zip(old_rows, rows)):
+                if old_row == new_row:
+                    continue
+                for column_index, (old_cell, new_cell) in enumerate(zip(old_row, new_row)):
+                    if old_cell != new_cell:
+                        table.update_cell_at(Coordinate(row_index, column_index), new_cell)
+
+            if len(rows) < len(old_rows):
+                for row_key in self._row_keys[len(rows):]:
+                    table.remove_row(row_key)
+                del self._row_keys[len(rows):]
+            elif len(rows) > len(old_rows):
+                self._row_keys.extend(table.add_rows(rows[len(old_rows):]))
+
+        self._row_snapshot = list(rows)
+
+    def request_refresh(self):
+        """Schedule a refresh of the current view, coalescing repeated requests."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.call_after_refresh(self._do_refresh)
+
+    def _do_refresh(self):
+        """Re-render the current view if the playlists changed since last render."""
+        self._refresh_pending = False
+        if self._rendered_version == self.playlist_manager.version:
+            return
+        if self.viewing_playlist_tracks and self.selected_playlist in self.playlist_manager.get_playlist_names():
+            self.show_playlist_tracks(self.selected_playlist)
+        else:
+            self.refresh_playlist_list()
+
     def show_playlist_tracks(self, playlist_name: str):
         """Show tracks in the selected playlist."""
         self.viewing_playlist_tracks = True
         self.selected_playlist = playlist_name
         self.current_playlist_tracks = self.playlist_manager.get_playlist(playlist_name)
         
-        # Update table
-        self.content_table.clear(columns=True)
-        self.content_table.add_columns("Title", "Artist", "Album", "Duration")
-        
         if not self.current_playlist_tracks:
-            self.content_table.add_row("No tracks in playlist", "Add some tracks", "", "")
+            rows = [("No tracks in playlist", "Add some tracks", "", "")]
         else:
-            for track in self.current_playlist_tracks:
-                duration = track.get("duration", 0)
-                minutes = int(duration // 60)
-                seconds = int(duration % 60)
-                duration_str = f"{minutes}:{seconds:02d}"
-                
-                self.content_table.add_row(
+            rows = [
+                (
                     track.get("title", "Unknown"),
                     track.get("artist", "Unknown"),
                     track.get("albumTitle", "Unknown"),
-                    duration_str
+                    get_duration_str(track),
                 )
+                for track in self.current_playlist_tracks
+            ]
+
+        self._set_rows(("Title", "Artist", "Album", "Duration"), rows)
         
         # Update UI state
-        self.query_one("#back-to-playlists-btn").remove_class("hidden")
+        self._rendered_version = self.playlist_manager.version
+        self.back_button.remove_class("hidden")
         self.status_label.update(f"Playlist: {playlist_name} ({len(self.current_playlist_tracks)} tracks)")
     
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    def _remove_track_row(self, row_index: int):
+        """Drop a single removed track's row instead of re-rendering the playlist."""
+        self.current_playlist_tracks = self.playlist_manager.get_playlist(self.selected_playlist)
+        if not self.current_playlist_tracks or row_index >= len(self._row_keys):
+            self.show_playlist_tracks(self.selected_playlist)
+            return
+
+        self.content_table.remove_row(self._row_keys.pop(row_index))
+        del self._row_snapshot[row_index]
+        self._rendered_version = self.playlist_manager.version
+        self.status_label.update(
+            f"Playlist: {self.selected_playlist} ({len(self.current_playlist_tracks)} tracks)"
+        )
+
+    def _clear_track_rows(self):
+        """Empty the track table in one go after its playlist was cleared."""
+        self.current_playlist_tracks = self.playlist_manager.get_playlist(self.selected_playlist)
+        rows = [("No tracks in playlist", "Add some tracks", "", "")]
+        table = self.content_table
+        with self.app.batch_update():
+            table.clear(columns=False)
+            self._row_keys = table.add_rows(rows)
+        self._row_snapshot = rows
+        self._rendered_version = self.playlist_manager.version
+        self.status_label.update(f"Playlist: {self.selected_playlist} (0 tracks)")
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "create-playlist-btn":
-            self.create_playlist()
+            await self.create_playlist()
         elif event.button.id == "back-to-playlists-btn":
             self.refresh_playlist_list()
         elif event.button.id == "delete-playlist-btn":
-            self.delete_selected()
+            await self.delete_selected()
         elif event.button.id == "rename-playlist-btn":
             self.rename_selected()
         elif event.button.id == "clear-playlist-btn":
             self.clear_selected()
     
-    def create_playlist(self):
+    async def create_playlist(self):
         """Create a new playlist."""
         name = self.new_playlist_input.value.strip()
         if not name:
             self.notify("Please enter a playlist name", title="Create Playlist")
             return
+
+        await self.playlist_manager.aensure_loaded()
         
         if self.playlist_manager.create_playlist(name):
             self.new_playlist_input.value = ""
@@ -144,8 +225,9 @@ class PlaylistDisplay(Widget):
         else:
             self.notify(f"Failed to create playlist (may already exist)", title="Error")
     
-    def delete_selected(self):
+    async def delete_selected(self):
         """Delete the selected playlist or track."""
+        await self.playlist_manager.aensure_loaded()
         if self.viewing_playlist_tracks:
             # Delete selected track from playlist
             if self.content_table.cursor_row is not None and self.current_playlist_tracks:
@@ -153,7 +235,7 @@ class PlaylistDisplay(Widget):
                 if 0 <= track_index < len(self.current_playlist_tracks):
                     track = self.current_playlist_tracks[track_index]
                     if self.playlist_manager.remove_track_from_playlist(self.selected_playlist, track_index):
-                        self.show_playlist_tracks(self.selected_playlist)  # Refresh
+                        self._remove_track_row(track_index)
                         self.notify(f"Removed track: {track.get('title', 'Unknown')}", title="Success")
                     else:
                         self.notify("Failed to remove track", title="Error")
@@ -187,7 +269,7 @@ class PlaylistDisplay(Widget):
         """Clear all tracks from selected playlist."""
         if self.viewing_playlist_tracks and self.selected_playlist:
             if self.playlist_manager.clear_playlist(self.selected_playlist):
-                self.show_playlist_tracks(self.selected_playlist)  # Refresh
+                self._clear_track_rows()
                 self.notify(f"Cleared playlist: {self.selected_playlist}", title="Success")
             else:
                 self.notify("Failed to clear playlist", title="Error")
@@ -198,10 +280,28 @@ class PlaylistDisplay(Widget):
         """Handle row selection in the data table."""
         if not self.viewing_playlist_tracks:
             # User selected a playlist - show its tracks
-            playlists = self.playlist_manager.get_playlist_names()
-            if 0 <= event.cursor_row < len(playlists):
-                playlist_name = playlists[event.cursor_row]
-                self.show_playlist_tracks(playlist_name)
+            # Only open the latest of a quick run of selections
+            self._pending_row = event.cursor_row
+            if self._select_timer is not None:
+                self._select_timer.stop()
+            self._select_timer = self.set_timer(0.05, self._apply_selection)
+
+    def _apply_selection(self):
+        """Open the playlist for the most recently selected row."""
+        self._select_timer = None
+        row = self._pending_row
+        self._pending_row = None
+        if row is None or self.viewing_playlist_tracks:
+            return
+        playlists = self.playlist_manager.get_playlist_names()
+        if 0 <= row < len(playlists):
+            playlist_name = playlists[row]
+            self.run_worker(self._open_playlist(playlist_name), exclusive=True)
+
+    async def _open_playlist(self, playlist_name: str):
+        """Load playlists off the event loop if needed, then show the playlist's tracks."""
+        await self.playlist_manager.aensure_loaded()
+        self.show_playlist_tracks(playlist_name)
     
     def add_track_to_selected_playlist(self, track: dict) -> bool:
         """Add a track to the currently selected playlist."""
@@ -214,7 +314,7 @@ class PlaylistDisplay(Widget):
         """Get the name of the currently selected playlist."""
         return self.selected_playlist or ""
     
-    def on_input_submitted(self, event):
+    async def on_input_submitted(self, event):
         """Handle input submission."""
         if event.input.id == "new-playlist-input":
-            self.create_playlist()
\ No newline at end of file
+            await self.create_playlist()
\ No newline at end of file
@@ -1,52 +1,243 @@
+import asyncio
 import json
+import logging
 import os
+import threading
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for further changes before writing playlists to disk
+SAVE_DELAY = 0.5
+
+# Formatted durations keyed by track id, kept off the track dicts so they are never saved
+_duration_strs: Dict[object, tuple] = {}
+
+
+def get_duration_str(track: dict) -> str:
+    """Return the track's "m:ss" duration, formatting and caching it on first use."""
+    duration = track.get("duration", 0) or 0
+    track_id = track.get("id")
+    cached = _duration_strs.get(track_id)
+    if cached is not None and cached[0] == duration:
+        return cached[1]
+    minutes, seconds = divmod(int(duration), 60)
+    duration_str = f"{minutes}:{seconds:02d}"
+    if track_id is not None:
+        _duration_strs[track_id] = (duration, duration_str)
+    return duration_str
+
+
 class PlaylistManager:
     def __init__(self, playlists_file="playlists.json"):
         self.playlists_file = playlists_file
-        self.playlists: Dict[str, List[dict]] = {}
-        self.load_playlists()
+        # Loaded on first access so constructing the manager does no disk I/O
+        self._playlists: Optional[Dict[str, List[dict]]] = None
+        self._version = 0
+        # Sidecar index of track counts so listing playlists avoids a full parse
+        self.index_file = f"{os.path.splitext(playlists_file)[0]}.index.json"
+        # Temp paths for atomic writes, built once rather than on every save
+        self._tmp_file = f"{playlists_file}.tmp"
+        self._index_tmp_file = f"{self.index_file}.tmp"
+        self._counts: Optional[Dict[str, int]] = None
+        self._names_cache: Optional[List[str]] = None
+        # Track ids per playlist for O(1) duplicate checks, built on demand
+        self._playlist_ids: Dict[str, set] = {}
+        # Mutations are coalesced and written by a timer thread
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+
+    @property
+    def playlists(self) -> Dict[str, List[dict]]:
+        """Playlists keyed by name, loaded from disk on first access."""
+        if self._playlists is None:
+            self.ensure_loaded()
+        return self._playlists
+
+    @playlists.setter
+    def playlists(self, value: Dict[str, List[dict]]):
+        self._playlists = value
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every change so views can skip no-op refreshes."""
+        return self._version
     
     def load_playlists(self):
         """Load playlists from JSON file."""
+        with self._lock:
+            playlists = {}
+            try:
+                with open(self.playlists_file, 'rb') as f:
+                    playlists = self._loads(f.read())
+            except FileNotFoundError:
+                pass
+            except Exception:
+                logger.exception("Error loading playlists")
+                playlists = {}
+            # Publish only fully loaded data, other threads check _playlists unlocked
+            self._playlist_ids = {}
+            self._names_cache = None
+            self._counts = {name: len(tracks) for name, tracks in playlists.items()}
+            self._playlists = playlists
+            self._version += 1
+            self._save_index()
+
+    def ensure_loaded(self):
+        """Load playlists from disk unless they are already loaded."""
+        with self._lock:
+            if self._playlists is None:
+                self.load_playlists()
+
+    async def aensure_loaded(self):
+        """Load playlists in a worker thread so the event loop isn't blocked."""
+        if self._playlists is None:
+            await asyncio.get_event_loop().run_in_executor(None, self.ensure_loaded)
+
+    def _load_index(self) -> Optional[Dict[str, int]]:
+        """Return track counts from the sidecar index, or None if it is stale."""
+        try:
+            mtime_ns = os.stat(self.playlists_file).st_mtime_ns
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if index.get("mtime_ns") != mtime_ns:
+            return None
+        return index.get("counts")
+
+    def _save_index(self):
+        """Write the sidecar index for the current playlists file."""
         try:
-            if os.path.exists(self.playlists_file):
-                with open(self.playlists_file, 'r', encoding='utf-8') as f:
-                    self.playlists = json.load(f)
-        except Exception as e:
-            print(f"Error loading playlists: {e}")
-            self.playlists = {}
+            mtime_ns = os.stat(self.playlists_file).st_mtime_ns
+        except OSError:
+            return
+        tmp_file = self._index_tmp_file
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({"mtime_ns": mtime_ns, "counts": self._counts}, f)
+            os.replace(tmp_file, self.index_file)
+        except OSError:
+            logger.exception("Error saving playlist index")
+
+    def _get_counts(self) -> Dict[str, int]:
+        """Get track counts per playlist, from the index when playlists aren't loaded."""
+        if self._counts is None:
+            if self._playlists is None:
+                self._counts = self._load_index()
+                self._names_cache = None
+            if self._counts is None:
+                # Stale or missing index: load the playlists, which rebuilds it
+                self.load_playlists()
+        return self._counts
     
+    def _ids_for(self, playlist_name: str) -> set:
+        """Get the set of track ids in a playlist, building it on first use."""
+        ids = self._playlist_ids.get(playlist_name)
+        if ids is None:
+            ids = {
+                track["id"] for track in self.playlists[playlist_name]
+                if track.get("id") is not None
+            }
+            self._playlist_ids[playlist_name] = ids
+        return ids
+
+    def _loads(self, data: bytes):
+        """Parse playlist JSON bytes, using orjson when available."""
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data.decode('utf-8'))
+
+    def _dumps(self, data) -> bytes:
+        """Serialize playlists to indented JSON bytes, using orjson when available."""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
     def save_playlists(self):
         """Save playlists to JSON file."""
-        try:
-            with open(self.playlists_file, 'w', encoding='utf-8') as f:
-                json.dump(self.playlists, f, indent=2, ensure_ascii=False)
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            tmp_file = self._tmp_file
+            try:
+                data = self._dumps(self.playlists)
+                # Write to a temp file and swap it in so a crash never truncates playlists
+                with open(tmp_file, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_file, self.playlists_file)
+            except Exception:
+                logger.exception("Error saving playlists")
+                return False
+            # Only a successful write clears the flag, so a failed save is retried
+            self._dirty = False
+            self._save_index()
             return True
-        except Exception as e:
-            print(f"Error saving playlists: {e}")
-            return False
-    
+
+    def _schedule_save(self) -> bool:
+        """Record a change and schedule a coalesced write to disk."""
+        with self._lock:
+            self._version += 1
+            self._counts = {name: len(tracks) for name, tracks in self.playlists.items()}
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+        return True
+
+    def flush(self) -> bool:
+        """Write pending playlist changes to disk immediately."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            return self.save_playlists()
+
+    async def aflush(self) -> bool:
+        """Write pending playlist changes from a worker thread."""
+        return await asyncio.get_event_loop().run_in_executor(None, self.flush)
+
     def create_playlist(self, name: str) -> bool:
         """Create a new empty playlist."""
-        if not name or name in self.playlists:
-            return False
+        with self._lock:
+            if not name or name in self.playlists:
+                return False
+            self._names_cache = None
         
-        self.playlists[name] = []
-        return self.save_playlists()
+            self.playlists[name] = []
+            self._playlist_ids[name] = set()
+            return self._schedule_save()
     
     def delete_playlist(self, name: str) -> bool:
         """Delete a playlist."""
-        if name not in self.playlists:
-            return False
+        with self._lock:
+            if name not in self.playlists:
+                return False
+            self._names_cache = None
         
-        del self.playlists[name]
-        return self.save_playlists()
+            del self.playlists[name]
+            self._playlist_ids.pop(name, None)
+            return self._schedule_save()
     
     def get_playlist_names(self) -> List[str]:
-        """Get list of all playlist names."""
-        return list(self.playlists.keys())
+        """Get list of all playlist names.
+
+        The list is cached until a playlist is created, deleted or renamed,
+        so callers must not modify it.
+        """
+        if self._names_cache is None:
+            self._names_cache = list(self._get_counts())
+        return self._names_cache
     
     def get_playlist(self, name: str) -> List[dict]:
         """Get tracks from a specific playlist."""
@@ -54,60 +245,77 @@ class PlaylistManager:
     
     def add_track_to_playlist(self, playlist_name: str, track: dict) -> bool:
         """Add a track to a playlist."""
-        if playlist_name not in self.playlists:
-            return False
+        with self._lock:
+            if playlist_name not in self.playlists:
+                return False
         
-        # Check if track already exists in playlist (by ID)
-        track_id = track.get("id")
-        if track_id:
-            for existing_track in self.playlists[playlist_name]:
-                if existing_track.get("id") == track_id:
-                    return False  # Track already exists
+            # Check if track already exists in playlist (by ID)
+            track_id = track.get("id")
+            ids = self._ids_for(playlist_name)
+            if track_id and track_id in ids:
+                return False  # Track already exists
         
-        self.playlists[playlist_name].append(track)
-        return self.save_playlists()
+            get_duration_str(track)
+            self.playlists[playlist_name].append(track)
+            if track_id is not None:
+                ids.add(track_id)
+            return self._schedule_save()
     
     def remove_track_from_playlist(self, playlist_name: str, track_index: int) -> bool:
         """Remove a track from a playlist by index."""
-        if playlist_name not in self.playlists:
-            return False
+        with self._lock:
+            if playlist_name not in self.playlists:
+                return False
         
-        playlist = self.playlists[playlist_name]
-        if 0 <= track_index < len(playlist):
-            playlist.pop(track_index)
-            return self.save_playlists()
+            playlist = self.playlists[playlist_name]
+            if 0 <= track_index < len(playlist):
+                track = playlist.pop(track_index)
+                self._ids_for(playlist_name).discard(track.get("id"))
+                return self._schedule_save()
         
-        return False
+            return False
     
     def remove_track_by_id(self, playlist_name: str, track_id: str) -> bool:
         """Remove a track from a playlist by track ID."""
-        if playlist_name not in self.playlists:
-            return False
+        with self._lock:
+            if playlist_name not in self.playlists:
+                return False
         
-        playlist = self.playlists[playlist_name]
-        for i, track in enumerate(playlist):
-            if track.get("id") == track_id:
-                playlist.pop(i)
-                return self.save_playlists()
+            ids = self._ids_for(playlist_name)
+            if track_id not in ids:
+                return False
+
+            playlist = self.playlists[playlist_name]
+            for i, track in enumerate(playlist):
+                if track.get("id") == track_id:
+                    playlist.pop(i)
+                    ids.discard(track_id)
+                    return self._schedule_save()
         
-        return False
+            return False
     
     def get_playlist_count(self, name: str) -> int:
         """Get number of tracks in a playlist."""
-        return len(self.playlists.get(name, []))
+        return self._get_counts().get(name, 0)
     
     def rename_playlist(self, old_name: str, new_name: str) -> bool:
         """Rename a playlist."""
-        if old_name not in self.playlists or new_name in self.playlists or not new_name:
-            return False
+        with self._lock:
+            if old_name not in self.playlists or new_name in self.playlists or not new_name:
+                return False
+            self._names_cache = None
         
-        self.playlists[new_name] = self.playlists.pop(old_name)
-        return self.save_playlists()
+            self.playlists[new_name] = self.playlists.pop(old_name)
+            if old_name in self._playlist_ids:
+                self._playlist_ids[new_name] = self._playlist_ids.pop(old_name)
+            return self._schedule_save()
     
     def clear_playlist(self, name: str) -> bool:
         """Clear all tracks from a playlist."""
-        if name not in self.playlists:
-            return False
+        with self._lock:
+            if name not in self.playlists:
+                return False
         
-        self.playlists[name] = []
-        return self.save_playlists()
\ No newline at end of file
+            self.playlists[name] = []
+            self._playlist_ids[name] = set()
+            return self._schedule_save()
\ No newline at end of file
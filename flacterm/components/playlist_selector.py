@@ -19,6 +19,7 @@ class PlaylistSelectorModal(ModalScreen):
         self.playlist_manager = playlist_manager
         self.track_title = track_title
         self.action = action  # "add" or "remove"
+        self.playlists = []
     
     def compose(self) -> ComposeResult:
         with Vertical(id="playlist-selector-modal"):
@@ -42,21 +43,24 @@ class PlaylistSelectorModal(ModalScreen):
     
     def on_mount(self):
         """Initialize the modal when mounted."""
+        self.playlist_table.add_columns("Playlist Name", "Track Count")
         self.refresh_playlist_list()
         self.playlist_table.focus()
     
     def refresh_playlist_list(self):
         """Refresh the playlist list."""
-        self.playlist_table.clear(columns=True)
-        self.playlist_table.add_columns("Playlist Name", "Track Count")
-        
-        playlists = self.playlist_manager.get_playlist_names()
-        if not playlists:
-            self.playlist_table.add_row("No playlists available", "0")
-        else:
-            for playlist_name in playlists:
-                track_count = self.playlist_manager.get_playlist_count(playlist_name)
-                self.playlist_table.add_row(playlist_name, str(track_count))
+        table = self.playlist_table
+        self.playlists = self.playlist_manager.get_playlist_names()
+
+        with self.app.batch_update():
+            table.clear()
+            if not self.playlists:
+                table.add_row("No playlists available", "0")
+            else:
+                table.add_rows(
+                    (playlist_name, str(self.playlist_manager.get_playlist_count(playlist_name)))
+                    for playlist_name in self.playlists
+                )
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -72,7 +76,7 @@ class PlaylistSelectorModal(ModalScreen):
     def select_playlist(self):
         """Select the highlighted playlist."""
         if self.playlist_table.cursor_row is not None:
-            playlists = self.playlist_manager.get_playlist_names()
+            playlists = self.playlists
             if playlists and 0 <= self.playlist_table.cursor_row < len(playlists):
                 selected_playlist = playlists[self.playlist_table.cursor_row]
                 # Send result message to parent
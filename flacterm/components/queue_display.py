@@ -1,17 +1,34 @@
-from rich.panel import Panel
-from rich.table import Table
+from rich.style import Style
 from rich.text import Text
-from textual.widgets import Static
+from textual.widgets import DataTable
 from textual.reactive import reactive
 from textual.binding import Binding
 from .queue_manager import QueueManager
+from .playlist_manager import get_duration_str
 
+# (label, key, width) for each queue column; a width of None sizes to content
+_COLUMNS = (
+    ("#", "index", 3),
+    ("Title", "title", None),
+    ("Artist", "artist", None),
+    ("Duration", "duration", 8),
+)
 
-class QueueDisplay(Static, can_focus=True):
+# Cell styles, parsed once rather than from strings for every cell
+_CURRENT_TITLE_STYLE = Style.parse("bold white on rgb(40,40,60)")
+_CURRENT_ARTIST_STYLE = Style.parse("bold green on rgb(40,40,60)")
+_ARTIST_STYLE = Style.parse("green")
+_DURATION_STYLE = Style.parse("dim")
+
+# Placeholder row shown while the queue is empty
+_EMPTY_ROW = (Text(""), Text("Queue is empty. Add tracks with [a] key.", style="dim"), Text(""), Text(""))
+
+
+class QueueDisplay(DataTable):
     """Widget for displaying and interacting with the current queue."""
-    can_focus = True
-    queue_length = reactive(0)
-    current_track_index = reactive(-1)
+    # Exposed for watchers only; the table repaints itself when its rows change
+    queue_length = reactive(0, repaint=False, layout=False, always_update=False)
+    current_track_index = reactive(-1, repaint=False, layout=False, always_update=False)
 
     BINDINGS = [
         Binding("up", "move_up", "Select previous track"),
@@ -21,93 +38,204 @@ class QueueDisplay(Static, can_focus=True):
 
     def __init__(self, queue_manager: QueueManager, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.cursor_type = "row"
         self.queue_manager = queue_manager
         self.queue_manager.set_on_queue_change_callback(self._on_queue_change)
+        self.queue_manager.set_on_selection_change_callback(self._on_selection_change)
+        self._index_cache = {}
+        # Identity of each queued track and its table row, as last shown
+        self._last_track_ids = []
+        self._row_keys = []
+        # Row key of the row drawn as the current track
+        self._marked_key = None
+        self._columns_ready = False
+        # (queue version, current index) the rows were last synced to
+        self._synced_state = None
+        self._showing_empty = False
+
+    def on_mount(self):
+        for label, key, width in _COLUMNS:
+            self.add_column(label, key=key, width=width)
+        self._columns_ready = True
+        self.border_subtitle = Text("[d] Remove  [↑↓] Navigate  [Enter] Play")
+        self._sync_rows(self.queue_manager)
 
     def _on_queue_change(self, queue_manager):
         self.queue_length = len(queue_manager.queue)
         self.current_track_index = queue_manager.current_index
-        self.refresh()
-
-    def render(self):
-        table = Table(expand=True, box=None, padding=(0, 1, 0, 1))
-        table.add_column("#", justify="right", style="cyan", width=3)
-        table.add_column("Title", style="white", ratio=3)
-        table.add_column("Artist", style="green", ratio=2)
-        table.add_column("Duration", justify="right", style="dim", width=8)
-
-        queue = self.queue_manager.queue
-        current_index = self.queue_manager.current_index
+        if self._columns_ready:
+            self._sync_rows(queue_manager)
+
+    def _on_selection_change(self, queue_manager):
+        current_index = queue_manager.current_index
+        self.current_track_index = current_index
+        synced = self._synced_state
+        # Rows behind the queue are brought up to date by the pending queue change
+        if self._columns_ready and synced is not None and synced[0] == queue_manager.version:
+            self._mark_current(queue_manager.queue, current_index)
+            self._synced_state = (queue_manager.version, current_index)
+
+    def _sync_rows(self, queue_manager):
+        """
+        Bring the table in line with the queue, touching only the rows that changed.
+
+        Appends add rows, a single removal drops one row and renumbers the rows
+        below it, and a change of current track restyles just the old and new
+        current rows. Anything else (reorders, replacing the queue) rebuilds.
+
+        Args:
+            queue_manager: Queue to display
+        """
+        current_index = queue_manager.current_index
+        state = (queue_manager.version, current_index)
+        if state == self._synced_state:
+            return
+        self._synced_state = state
+
+        queue = queue_manager.queue
+        track_ids = list(queue_manager.track_ids)
+        old_ids = self._last_track_ids
+        self.border_title = f"Queue ({len(queue)})"
 
         if not queue:
-            empty_message = Text("Queue is empty. Add tracks with [a] key.", style="dim")
-            table.add_row(Text(""), empty_message, Text(""), Text(""))
-            return Panel(table, title="Queue (0)", border_style="cyan")
-
-        for i, track in enumerate(queue):
-            title = track.get("title", "Unknown Title")
-            artist = track.get("artist", "Unknown Artist")
-            duration = track.get("duration", 0)
-
-            if isinstance(duration, (int, float)):
-                minutes = int(duration // 60)
-                seconds = int(duration % 60)
-                duration_text = f"{minutes}:{seconds:02d}"
+            self._show_empty()
+        elif not old_ids:
+            self._rebuild(queue, current_index)
+        elif track_ids[:len(old_ids)] == old_ids:
+            start = len(old_ids)
+            self._row_keys.extend(self.add_rows(
+                self._row_cells(track, i, False)
+                for i, track in enumerate(queue[start:], start)
+            ))
+        else:
+            removed = self._removed_index(old_ids, track_ids)
+            if removed is None:
+                self._rebuild(queue, current_index)
             else:
-                duration_text = "--:--"
-
-            if i == current_index:
-                row_style = "bold white on rgb(40,40,60)"
-                index_text = Text("▶", style="bold cyan")
-                title_text = Text(title, style="bold white")
-                artist_text = Text(artist, style="bold green")
-                duration_text = Text(duration_text, style="bold white")
-            else:
-                row_style = ""
-                index_text = Text(f"{i+1}.", style="cyan")
-                title_text = Text(title)
-                artist_text = Text(artist, style="green")
-                duration_text = Text(duration_text, style="dim")
-
-            table.add_row(
-                index_text,
-                title_text,
-                artist_text,
-                duration_text,
-                style=row_style
+                row_key = self._row_keys.pop(removed)
+                self.remove_row(row_key)
+                if row_key == self._marked_key:
+                    self._marked_key = None
+                # Rows below the removed one move up a position
+                for i in range(removed, len(queue)):
+                    if self._row_keys[i] != self._marked_key:
+                        self.update_cell(self._row_keys[i], "index", self._index_text(i))
+
+        self._last_track_ids = track_ids
+        self._mark_current(queue, current_index)
+
+    def _rebuild(self, queue, current_index: int):
+        """Replace every row with the given queue."""
+        self.clear()
+        self._showing_empty = False
+        self._row_keys = self.add_rows(
+            self._row_cells(track, i, i == current_index)
+            for i, track in enumerate(queue)
+        )
+        if 0 <= current_index < len(self._row_keys):
+            self._marked_key = self._row_keys[current_index]
+        else:
+            self._marked_key = None
+
+    def _show_empty(self):
+        """Show the placeholder row for an empty queue."""
+        if self._showing_empty:
+            return
+        self.clear()
+        self.add_row(*_EMPTY_ROW)
+        self._row_keys = []
+        self._marked_key = None
+        self._showing_empty = True
+
+    def _mark_current(self, queue, current_index: int):
+        """Move the current-track styling to the row at current_index."""
+        row_keys = self._row_keys
+        new_key = row_keys[current_index] if 0 <= current_index < len(row_keys) else None
+        if new_key == self._marked_key:
+            return
+        if self._marked_key is not None:
+            old_index = row_keys.index(self._marked_key)
+            self._set_row_cells(old_index, self._row_cells(queue[old_index], old_index, False))
+        if new_key is not None:
+            self._set_row_cells(current_index, self._row_cells(queue[current_index], current_index, True))
+        self._marked_key = new_key
+
+    def _set_row_cells(self, index: int, cells):
+        """Overwrite every cell of the row at index."""
+        row_key = self._row_keys[index]
+        for (_, column_key, _), cell in zip(_COLUMNS, cells):
+            self.update_cell(row_key, column_key, cell)
+
+    @staticmethod
+    def _removed_index(old_ids, new_ids):
+        """Return the index removed from old_ids to give new_ids, or None if not a single removal."""
+        if len(old_ids) != len(new_ids) + 1:
+            return None
+        index = 0
+        for old_id, new_id in zip(old_ids, new_ids):
+            if old_id != new_id:
+                break
+            index += 1
+        if old_ids[index + 1:] != new_ids[index:]:
+            return None
+        return index
+
+    @staticmethod
+    def _format_duration(track) -> str:
+        """Return the track's duration as m:ss, or --:-- when it is not a number."""
+        if isinstance(track.get("duration", 0), (int, float)):
+            return get_duration_str(track)
+        return "--:--"
+
+    def _row_cells(self, track, index: int, is_current: bool):
+        """Build the four cells for a queue row."""
+        title = track.get("title", "Unknown Title")
+        artist = track.get("artist", "Unknown Artist")
+        duration_text = self._format_duration(track)
+
+        if is_current:
+            return (
+                self._index_text(None),
+                Text(title, style=_CURRENT_TITLE_STYLE),
+                Text(artist, style=_CURRENT_ARTIST_STYLE),
+                Text(duration_text, style=_CURRENT_TITLE_STYLE, justify="right"),
             )
-
-        return Panel(
-            table,
-            title=f"Queue ({len(queue)})",
-            border_style="cyan",
-            subtitle="[d] Remove  [↑↓] Navigate  [Enter] Play"
+        return (
+            self._index_text(index),
+            Text(title),
+            Text(artist, style=_ARTIST_STYLE),
+            Text(duration_text, style=_DURATION_STYLE, justify="right"),
         )
 
+    def _index_text(self, index):
+        """Return the cached position cell for index, or the play marker for None."""
+        index_text = self._index_cache.get(index)
+        if index_text is None:
+            if index is None:
+                index_text = Text("▶", style="bold cyan", justify="right")
+            else:
+                index_text = Text(f"{index+1}.", style="cyan", justify="right")
+            self._index_cache[index] = index_text
+        return index_text
+
     # === ACTIONS ===
 
     def action_move_up(self):
-        if self.queue_manager.queue and self.queue_manager.current_index > 0:
-            self.queue_manager.current_index -= 1
-            self.refresh()
+        self.action_cursor_up()
 
     def action_move_down(self):
-        if self.queue_manager.queue and self.queue_manager.current_index < len(self.queue_manager.queue) - 1:
-            self.queue_manager.current_index += 1
-            self.refresh()
+        self.action_cursor_down()
 
     def action_play_selected(self):
-        index = self.queue_manager.current_index
+        index = self.cursor_row
         if 0 <= index < len(self.queue_manager.queue):
             track = self.queue_manager.queue[index]
-            results = self.app.query_one("#results", expect_type=True)
+            # The app is the Results view; no need to search the DOM for it
+            results = self.app
             if hasattr(results, "play_track"):
                 results.play_track(track)
 
     def action_remove_selected(self):
-        index = self.queue_manager.current_index
+        index = self.cursor_row
         if 0 <= index < len(self.queue_manager.queue):
             self.queue_manager.remove_track(index)
-            if self.queue_manager.current_index >= len(self.queue_manager.queue):
-                self.queue_manager.current_index = max(0, len(self.queue_manager.queue) - 1)
-            self.refresh()
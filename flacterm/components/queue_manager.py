@@ -2,10 +2,12 @@
 Queue manager component for DAB Terminal Music Player.
 Handles track queuing functionality.
 """
-from typing import List, Dict, Optional, Callable
-from rich.console import Console
+import asyncio
+import logging
+from typing import List, Dict, Iterable, Optional, Callable
+
+logger = logging.getLogger(__name__)
 
-console = Console()
 
 class QueueManager:
     """Manages the playback queue for the music player."""
@@ -13,14 +15,32 @@ class QueueManager:
     def __init__(self):
         """Initialize an empty queue."""
         self._queue: List[Dict] = []
+        # id() of each queued track, kept in step with _queue
+        self._track_ids: List[int] = []
         self._current_index: int = -1
+        self._version = 0
         self._on_queue_change_callback: Optional[Callable] = None
+        # Called when only the current track moves, so views can restyle two rows
+        self._on_selection_change_callback: Optional[Callable] = None
+        # Set while a coalesced change notification is waiting to run
+        self._notify_pending = False
+        self._selection_pending = False
         
     @property
     def queue(self) -> List[Dict]:
         """Return the current queue."""
         return self._queue
         
+    @property
+    def track_ids(self) -> List[int]:
+        """Return the identity of each queued track, in queue order."""
+        return self._track_ids
+        
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the queued tracks change so views can skip no-op refreshes."""
+        return self._version
+        
     @property
     def current_index(self) -> int:
         """Return the current track index."""
@@ -33,6 +53,13 @@ class QueueManager:
             return self._queue[self._current_index]
         return None
     
+    @property
+    def next_up(self) -> Optional[Dict]:
+        """Return the track after the current one without moving to it, or None."""
+        if self._current_index + 1 < len(self._queue):
+            return self._queue[self._current_index + 1]
+        return None
+    
     def add_track(self, track: Dict) -> None:
         """
         Add a track to the queue.
@@ -41,11 +68,27 @@ class QueueManager:
             track: Track information dictionary
         """
         self._queue.append(track)
+        self._track_ids.append(id(track))
         # If this is the first track, set current index to 0
         if len(self._queue) == 1:
             self._current_index = 0
         self._notify_queue_change()
         
+    def add_tracks(self, tracks: Iterable[Dict]) -> None:
+        """
+        Add several tracks to the queue with a single change notification.
+        
+        Args:
+            tracks: Track information dictionaries
+        """
+        was_empty = not self._queue
+        start = len(self._queue)
+        self._queue.extend(tracks)
+        self._track_ids.extend(id(track) for track in self._queue[start:])
+        if was_empty and self._queue:
+            self._current_index = 0
+        self._notify_queue_change()
+        
     def remove_track(self, index: int) -> bool:
         """
         Remove a track from the queue by index.
@@ -68,6 +111,7 @@ class QueueManager:
             
             # Remove the track
             self._queue.pop(index)
+            self._track_ids.pop(index)
             
             # If queue is now empty, reset current index
             if not self._queue:
@@ -83,6 +127,7 @@ class QueueManager:
     def clear_queue(self) -> None:
         """Clear the entire queue."""
         self._queue = []
+        self._track_ids = []
         self._current_index = -1
         self._notify_queue_change()
     
@@ -98,7 +143,7 @@ class QueueManager:
         
         if self._current_index < len(self._queue) - 1:
             self._current_index += 1
-            self._notify_queue_change()
+            self._notify_selection_change()
             return self._queue[self._current_index]
         return None
     
@@ -114,7 +159,7 @@ class QueueManager:
         
         if self._current_index > 0:
             self._current_index -= 1
-            self._notify_queue_change()
+            self._notify_selection_change()
             return self._queue[self._current_index]
         return None
     
@@ -130,8 +175,22 @@ class QueueManager:
             True if successful, False otherwise
         """
         if 0 <= from_index < len(self._queue) and 0 <= to_index < len(self._queue):
+            if abs(from_index - to_index) == 1:
+                # Moving by one place is a swap, which avoids shifting the list twice
+                queue = self._queue
+                queue[from_index], queue[to_index] = queue[to_index], queue[from_index]
+                ids = self._track_ids
+                ids[from_index], ids[to_index] = ids[to_index], ids[from_index]
+                if self._current_index == from_index:
+                    self._current_index = to_index
+                elif self._current_index == to_index:
+                    self._current_index = from_index
+                self._notify_queue_change()
+                return True
+
             # Save the track and remove from current position
             track = self._queue.pop(from_index)
+            track_id = self._track_ids.pop(from_index)
             
             # Track the current track if it's being moved
             is_current = from_index == self._current_index
@@ -146,6 +205,7 @@ class QueueManager:
                 
             # Insert track at new position
             self._queue.insert(to_index, track)
+            self._track_ids.insert(to_index, track_id)
             self._notify_queue_change()
             return True
         return False
@@ -159,13 +219,75 @@ class QueueManager:
         """
         self._on_queue_change_callback = callback
         
+    def set_on_selection_change_callback(self, callback: Callable) -> None:
+        """
+        Set callback for when only the current track changes.
+        
+        Without one, selection changes are reported as queue changes.
+        
+        Args:
+            callback: Function to call when the current track changes
+        """
+        self._on_selection_change_callback = callback
+        
     def _notify_queue_change(self) -> None:
-        """Notify listeners that the queue has changed."""
+        """
+        Notify listeners that the queue has changed.
+        
+        Inside an event loop the notification is deferred to the loop's next
+        iteration, so a burst of changes reaches listeners once. Outside one it
+        is delivered immediately.
+        """
+        self._version += 1
+        if self._notify_pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_queue_change()
+            return
+        self._notify_pending = True
+        loop.call_soon(self._flush_queue_change)
+
+    def _flush_queue_change(self) -> None:
+        """Deliver a pending queue change notification."""
+        self._notify_pending = False
         if self._on_queue_change_callback:
             try:
                 self._on_queue_change_callback(self)
-            except Exception as e:
-                console.print(f"Error in queue change callback: {e}")
+            except Exception:
+                logger.exception("Error in queue change callback")
+
+    def _notify_selection_change(self) -> None:
+        """
+        Notify listeners that the current track changed but the tracks did not.
+        
+        Deferred like queue change notifications, and folded into a queue
+        change that is already waiting since that reports the new index too.
+        """
+        if not self._on_selection_change_callback:
+            self._notify_queue_change()
+            return
+        if self._notify_pending or self._selection_pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_selection_change()
+            return
+        self._selection_pending = True
+        loop.call_soon(self._flush_selection_change)
+
+    def _flush_selection_change(self) -> None:
+        """Deliver a pending selection change notification."""
+        self._selection_pending = False
+        if self._notify_pending:
+            # The queue change about to be delivered covers the new index
+            return
+        try:
+            self._on_selection_change_callback(self)
+        except Exception:
+            logger.exception("Error in selection change callback")
 
     def get_all_tracks(self) -> List[Dict]:
         """
@@ -7,34 +7,76 @@ from textual.containers import ScrollableContainer, Vertical, Container, Horizon
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from math import ceil
-import threading
-import time
-import os
 import re
 import asyncio
+import contextvars
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from .audio_player import AudioPlayer
-from .lyrics_display import LyricsDisplay
+from .lyrics_display import LyricsDisplay, prefetch_lyrics
 from .keybinds_display import KeybindsDisplay
 from ..utils.api import (
     fetch_all_results,
     get_streaming_url,
     get_track_detail,
     get_base_url,
-    download_track
+    download_track,
+    clear_caches,
+    close_disk_cache
 )
 
 from .queue_manager import QueueManager
 from .queue_display import QueueDisplay
-from .playlist_manager import PlaylistManager
+from .playlist_manager import PlaylistManager, get_duration_str
 from .playlist_display import PlaylistDisplay
 from .playlist_selector import PlaylistSelectorModal, PlaylistSelectionResult
 
 
 # Constants
 ITEMS_PER_PAGE = 10
+# Progress bar fills, sliced to length instead of built by repetition each tick
+_MAX_BAR = 512
+_BAR_FULL = "█" * _MAX_BAR
+_BAR_EMPTY = "░" * _MAX_BAR
+_IDLE_BAR = f"▕{_BAR_EMPTY[:30]}▏ 0:00 / 0:00 (Not Playing)"
 console = Console()
+logger = logging.getLogger(__name__)
+
+
+def _run_in_daemon_thread(func, *args):
+    """
+    Run a call on its own daemon thread and return a future for its result.
+
+    Executor threads are joined when the interpreter exits, so calls that can
+    run for a long time, like downloads, go here instead and never hold up quitting.
+    """
+    loop = asyncio.get_event_loop()
+    future = loop.create_future()
+
+    def resolve(result, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def target():
+        try:
+            outcome = (func(*args), None)
+        except Exception as e:
+            outcome = (None, e)
+        try:
+            loop.call_soon_threadsafe(resolve, *outcome)
+        except RuntimeError:
+            # The app quit and closed its loop first; nobody is waiting anymore
+            pass
+
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
 
 class Results(App):
     CSS = """
@@ -47,16 +89,6 @@ class Results(App):
   border: none;
 }
 
-#progress_visual {
-  width: 100%;
-  height: 1;
-  content-align: center middle;
-  color: $text-muted;
-  background: transparent;
-  padding: 0;
-  margin: 0;
-}
-
 #progress_bar {
   dock: bottom;
   text-align: center;
@@ -68,19 +100,6 @@ class Results(App):
   margin: 0;
 }
 
-/* Style for the timestamp when playing */
-.playing {
-  color: $success;
-}
-
-.paused {
-  color: $warning;
-}
-
-#footer {
-  dock: bottom;
-}
-
 /* Ensure there's space between the table and the timestamp display */
 #results_table {
   margin-bottom: 1;
@@ -95,37 +114,6 @@ class Results(App):
   display: block;
   border-top: solid #333;
 }
-
-/* Hide queue when not active */
-#queue-display.hidden {
-  display: none;
-}
-
-/* Additional styles for queue items */
-.queue-item {
-  padding: 1 2;
-}
-
-.queue-item:hover {
-  background: rgba(255, 255, 255, 0.05);
-}
-
-.queue-item.current {
-  background: rgba(255, 255, 255, 0.1);
-  text-style: bold;
-}
-
-/* Empty queue message */
-.empty-queue {
-  text-align: center;
-  padding: 5;
-  color: #888;
-}
-
-/* Queue panel title */
-#queue-display Panel {
-  border: round;
-}
 """
 
     BINDINGS = [
@@ -152,108 +140,126 @@ class Results(App):
         ("e", "show_normal_results", "Show Normal Results"),
         ("ctrl+a", "quick_add_to_playlist", "Quick Add to Playlist"),
         ("ctrl+r", "quick_remove_from_playlist", "Remove from Playlist"),
+        ("R", "clear_cache", "Clear Cache"),
     ]
 
+    # Visibility of the queue and playlist panels; watchers show or hide them
+    show_queue = reactive(False, init=False)
+    show_playlists = reactive(False, init=False)
+
     def __init__(self, results=None, search_type="track", query=""):
         super().__init__()
-        self.results = results or []
+        self._set_results(results or [])
         self.search_type = search_type
         self.query = query
         self.current_track_info = None
         self.showing_info = False
-        self.current_page = 0
-        self.total_pages = ceil(len(self.results) / ITEMS_PER_PAGE) if self.results else 0
         self.player = AudioPlayer()
+        # Shared worker threads for blocking network and player calls
+        self._io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="flacterm-io")
+        # Player calls run one at a time, in the order they were requested
+        self._player_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="flacterm-player")
+        # Bumped on every play request, so an older request can tell it was superseded
+        self._play_request = 0
         self.currently_playing = None
+        # (artist, title) of currently_playing, worked out once per track for lyrics lookups
+        self.current_track_key = None
         self.is_paused = False
         self.repeat = False
+        # Panels created on first use, since many sessions never open them
         self.lyrics_display = None
-        self.progress_bar_content = None
-        self.progress_ticker = None  # For regular UI updates
+        self.keybinds_display = None
+        self.queue_display = None
+        self.playlist_display = None
+        # Cells available to the bar, measured on mount and resize rather than every tick,
+        # and the last position tick sent to the UI, so the player thread can drop
+        # ticks that would redraw the same bar
+        self._bar_width = 60
+        self._last_tick = None
+        # Everything the progress bar shows, as last drawn, so unchanged ticks skip the redraw
+        self._bar_state = None
+        # Seek requested by fast forward/rewind presses but not yet applied
+        self._pending_seek_ms = 0
+        self._seek_timer = None
+        # Pending debounced search and lyrics fetch; a newer request restarts them
+        self._search_timer = None
+        # Bumped per search so pages from a superseded one are ignored
+        self._search_id = 0
+        # Set once a search's first page is shown, until its last page arrives
+        self._results_loading = False
+        self._lyrics_timer = None
         self.displayed_results = []  # To keep track of currently displayed results
+        # (results list, page, result count) the table rows were last built from
+        self._rendered_page = None
         # Initialize queue manager
         self.queue_manager = QueueManager()
-        # Track visibility of queue
-        self.show_queue = False
         self.playlist_manager = PlaylistManager()
-        self.show_playlists = False
         self.viewing_queue = False  # Track if we're viewing queue as results
         self.original_results = None  # Store original results when viewing queue
-        self.playlist_manager = PlaylistManager()
+        self._original_rows = None
         self.show_playlist_panel = False
 
     def compose(self) -> ComposeResult:
-        yield Header(f"DAB Terminal - Search: '{self.query}'")
+        self.header = Header(f"DAB Terminal - Search: '{self.query}'")
+        yield self.header
 
-        # Main vertical layout
-        with Vertical():
+        # Main vertical layout; the help, lyrics, queue and playlist panels
+        # start hidden and are mounted into it the first time they are shown
+        self.main_view = Vertical()
+        with self.main_view:
             self.search_input = Input(placeholder="Search for a new track...", id="search_input")
             self.search_input.styles.display = "none"
             yield self.search_input
 
-            self.keybinds_display = KeybindsDisplay(id="keybinds_display")
-            self.keybinds_display.styles.display = "none"
-            yield self.keybinds_display
-
             self.now_playing = Static("Not Playing", id="now_playing")
             yield self.now_playing
 
-            self.lyrics_display = LyricsDisplay(id="lyrics_display")
-            self.lyrics_display.styles.display = "none"
-            yield self.lyrics_display
-
             self.table = DataTable(id="results_table")
             yield self.table
 
-            yield DataTable(id="queue_table")
-
             self.pagination = Static(id="pagination")
             yield self.pagination
 
             self.info = Static("", id="info")
             yield self.info
 
-            yield QueueDisplay(self.queue_manager, id="queue-display", classes="hidden")
-
-            self.playlist_display = PlaylistDisplay(self.playlist_manager, id="playlist-display")
-            self.playlist_display.styles.display = "none"
-            yield self.playlist_display
-
         # Docked progress bar at the bottom
         with Container(id="progress_container"):
-            yield Static("", id="progress_bar")  # This gets updated with timestamp + bar
+            self.progress_bar = Static("", id="progress_bar")  # This gets updated with timestamp + bar
+            yield self.progress_bar
 
     def on_mount(self):
         """Set up the UI when the app is mounted."""
         self.table.cursor_type = "row"
         self.table.zebra_stripes = True
         self.table.show_cursor = True
+        self.table.add_columns("Title", "Artist", "Album", "Duration")
         self.table.focus()
         self.update_page()
 
         self.theme = 'gruvbox'
-        self.keybinds_display = self.query_one("#keybinds_display")
-        self.keybinds_display.styles.display = "none"
 
-        self.lyrics_display = self.query_one("#lyrics_display")
-        self.lyrics_display.styles.display = "none"
+        # Captured for scheduling progress updates straight from the player thread
+        self._loop = asyncio.get_event_loop()
+        self._app_context = contextvars.copy_context()
 
         self.player.set_position_callback(self.update_progress)
         self.player.set_on_end_callback(self.on_track_end)
 
-        self.set_interval(0.5, self.check_progress_updates)
+        self.call_after_refresh(self._measure_progress_bar)
 
-        self.query_one("#queue-display").display = False
+    def on_resize(self, event):
+        """Re-measure the progress bar once the new layout is in place."""
+        self.call_after_refresh(self._measure_progress_bar)
 
-        self.query_one("#playlist-display").display = False
-
-    def check_progress_updates(self):
-        """Regular timer callback to ensure progress bar updates."""
-        if self.player.is_currently_playing():
-            position = self.player.get_current_time()
-            duration = self.player.get_duration()
-            if duration > 0:
-                self._update_progress_ui(position, duration)
+    def _measure_progress_bar(self):
+        """Size the bar to the progress line, leaving room for the time text."""
+        width = self.progress_bar.size.width or 80  # Fallback if width not yet known
+        bar_width = min(max(width - 20, 10), _MAX_BAR)
+        if bar_width != self._bar_width:
+            self._bar_width = bar_width
+            # Redraw at the new width on the next tick
+            self._last_tick = None
 
     def play_track(self, track):
         """Play a track and update the UI accordingly."""
@@ -262,8 +268,21 @@ class Results(App):
             self.notify("No track ID found", title="Play Error")
             return
 
+        # A newer play request replaces one still waiting on the network
+        self._play_request += 1
+        self.run_worker(
+            self._play_track(track, self._play_request), group="playback", exclusive=True
+        )
+
+    async def _play_track(self, track, request):
+        """Fetch the track's stream URL off the event loop and start playback."""
+        loop = asyncio.get_event_loop()
         self.stop_playback()
-        stream_url = get_streaming_url(track_id)
+        # Also abandons a play still waiting for VLC to start
+        self.player.stop()
+        stream_url = await loop.run_in_executor(self._io_executor, get_streaming_url, track["id"])
+        if request != self._play_request:
+            return
         if not stream_url:
             self.notify("No streaming URL found", title="Play Error")
             return
@@ -273,48 +292,121 @@ class Results(App):
 
         # Store current track info
         self.currently_playing = track
+        self.current_track_key = self._track_key(track)
         self.is_paused = False
+        self._bar_state = None
+        self._last_tick = None
 
         # Update UI to show what's playing
         repeat_status = "[Repeat ON]" if self.repeat else ""
         self.now_playing.update(f"Now Playing: {track.get('title')} - {track.get('artist')} {repeat_status}")
 
-        # Start playback using the URL
-        self.player.play(stream_url)
+        # Look up lyrics while VLC starts, so showing them later is instant
+        self.run_worker(self._prefetch_lyrics(track), group="lyrics-prefetch", exclusive=True)
+
+        # Start playback using the URL; play() waits for VLC to start
+        await loop.run_in_executor(self._player_executor, self._start_player, stream_url, request)
+        if request != self._play_request:
+            return
+
+        # Resolve the next queued track's stream URL now, so moving on to it
+        # (auto-advance through a playlist, or skipping ahead) starts without a round trip
+        next_track = self.queue_manager.next_up
+        if next_track is not None and next_track.get("id"):
+            loop.run_in_executor(self._io_executor, get_streaming_url, next_track["id"])
 
         # Fetch lyrics if the lyrics display is visible
-        if self.lyrics_display.styles.display != "none":
-            artist = track.get("artist", "")
-            title = track.get("title", "")
-            self.lyrics_display.fetch_lyrics(artist, title)
+        if self.lyrics_visible:
+            self._fetch_lyrics(self.current_track_key)
 
         self.notify(f"Playing: {track.get('title')}", title="Now Playing")
 
+    def _start_player(self, stream_url, request):
+        """Start VLC on the player thread, unless a newer play request came in while queued."""
+        if request == self._play_request:
+            self.player.play(stream_url)
+
+    @staticmethod
+    def _track_key(track):
+        """Return the (artist, title) pair lyrics are looked up by."""
+        return track.get("artist", ""), track.get("title", "")
+
+    def _fetch_lyrics(self, track_key):
+        """Load lyrics for an (artist, title) pair once requests have settled for 200 ms."""
+        if self._lyrics_timer is not None:
+            self._lyrics_timer.stop()
+            self._lyrics_timer = None
+        artist, title = track_key
+        if not artist or not title:
+            # No metadata to search by, so don't go to the network at all
+            self.workers.cancel_group(self, "lyrics")
+            self.lyrics_display.clear_lyrics()
+            return
+        self._lyrics_timer = self.set_timer(0.2, lambda: self._start_lyrics_fetch(track_key))
+
+    def _start_lyrics_fetch(self, track_key):
+        """Load lyrics into the lyrics display without blocking the UI."""
+        self._lyrics_timer = None
+        artist, title = track_key
+        self.run_worker(
+            self.lyrics_display.fetch_lyrics_async(artist, title, executor=self._io_executor),
+            group="lyrics",
+            exclusive=True,
+        )
+
+    def _cancel_lyrics_fetch(self):
+        """Abandon any lyrics fetch in flight so a late response can't replace newer lyrics."""
+        if self._lyrics_timer is not None:
+            self._lyrics_timer.stop()
+            self._lyrics_timer = None
+        self.workers.cancel_group(self, "lyrics")
+
+    async def _prefetch_lyrics(self, track):
+        """Fetch lyrics for the given track and the next queued one into the lyrics cache."""
+        loop = asyncio.get_event_loop()
+        track_keys = [self.current_track_key]
+        next_track = self.queue_manager.next_up
+        if next_track is not None:
+            track_keys.append(self._track_key(next_track))
+        for artist, title in track_keys:
+            # A newer track has started; its own prefetch takes over
+            if self.currently_playing is not track:
+                return
+            await loop.run_in_executor(self._io_executor, prefetch_lyrics, artist, title)
+
     def update_progress(self, position, duration):
         """Callback for audio player to update progress."""
-        if duration == 0:
-            percent = 0
-        else:
-            percent = position / duration
+        if self.currently_playing is None or self.is_paused:
+            return
+
+        # Unless lyrics need the exact position, skip ticks that leave the bar as it is
+        if not self.lyrics_visible:
+            bar_width = self._bar_width
+            filled = int(bar_width * min(position / duration, 1.0)) if duration > 0 else 0
+            tick = (bar_width, filled, int(position), int(duration))
+            if tick == self._last_tick:
+                return
+            self._last_tick = tick
 
-        # Call UI update from player thread
-        self.call_from_thread(lambda: self._update_progress_ui(position, duration))
+        # Schedule the UI update from the player thread without waiting on it
+        self._loop.call_soon_threadsafe(
+            self._update_progress_ui, position, duration, context=self._app_context
+        )
 
     def _update_progress_ui(self, position, duration):
         """Updates the UI components on the main thread."""
-        try:
-            progress_bar = self.query_one("#progress_bar", Static)
-            if not progress_bar:
-                return
-            width = progress_bar.size.width or 80  # Fallback if width not yet known
-        except Exception:
-            width = 80
+        if self.lyrics_visible:
+            self.lyrics_display.update_position(position)
 
-        bar_width = max(width - 20, 10)  # Leave room for time text
+        bar_width = self._bar_width
         percent = min(position / duration, 1.0) if duration > 0 else 0
         filled = int(bar_width * percent)
-        empty = bar_width - filled
-        bar = f"▕{'█' * filled}{'░' * empty}▏"
+        bar_state = (bar_width, filled, int(position), int(duration), self.is_paused, bool(self.currently_playing))
+        if bar_state == self._bar_state:
+            return
+        self._bar_state = bar_state
+
+        bar = f"▕{_BAR_FULL[:filled]}{_BAR_EMPTY[:bar_width - filled]}▏"
 
         minutes_pos, seconds_pos = divmod(int(position), 60)
         minutes_dur, seconds_dur = divmod(int(duration), 60)
@@ -325,10 +417,7 @@ class Results(App):
         time_text = f"{minutes_pos}:{seconds_pos:02d} / {minutes_dur}:{seconds_dur:02d} {status}"
         progress_text = f"{bar} {time_text}"
 
-        progress_bar.update(progress_text)
-
-        if hasattr(self, 'lyrics_display') and self.lyrics_display.styles.display != "none":
-            self.lyrics_display.update_position(position)
+        self.progress_bar.update(progress_text)
 
     def get_selected_track(self):
         """
@@ -344,18 +433,47 @@ class Results(App):
 
     def on_track_end(self):
         """Handle end of track by playing the next track in queue if available."""
-        # Check if we should automatically play the next track
+        # Called on the player's position thread, so hand over to the event loop
+        self.call_from_thread(self._play_next_queued)
+
+    def _play_next_queued(self):
+        """Play the next track in the queue, if there is one."""
         next_track = self.queue_manager.next_track()
         if next_track:
             self.play_track(next_track)
 
     def stop_playback(self):
+        self._do_stop()
+
+    def _do_stop(self, *, reset_bar=False, hide_lyrics=False, notify=True):
+        """
+        Stop playback and reset the now-playing state.
+
+        Args:
+            reset_bar: Also show an empty progress bar
+            hide_lyrics: Also hide the lyrics display
+            notify: Show a "Playback stopped" notification
+        """
+        # Lyrics still loading belong to the track being stopped
+        self._cancel_lyrics_fetch()
+
         if self.currently_playing:
             self.player.stop()
             self.currently_playing = None
+            self.current_track_key = None
             self.is_paused = False
             self.now_playing.update("Not Playing")
-            self.notify("Playback stopped", title="Playback")
+
+            if reset_bar:
+                self._bar_state = None
+                self._last_tick = None
+                self.progress_bar.update(_IDLE_BAR)
+
+            if notify:
+                self.notify("Playback stopped", title="Playback")
+
+        if hide_lyrics:
+            self._hide_lyrics(notify=False)
 
     def _handle_playlist_play_callback(self, playlist_name: str, tracks: list):
         """Handle playlist play callback from playlist manager."""
@@ -368,43 +486,103 @@ class Results(App):
         if self.repeat and self.currently_playing:
             self.play_track(self.currently_playing)
         else:
-            self.currently_playing = None
-            self.now_playing.update("Not Playing")
+            self._do_stop(notify=False)
+
+    def _set_results(self, results, rows=None):
+        """
+        Replace the results being paged through and go back to the first page.
+
+        The list is kept rather than copied, so code must rebind self.results
+        through here instead of changing it in place.
+
+        Args:
+            results: Tracks to show
+            rows: Table rows already built for these results (optional)
+        """
+        self.results = results
+        # Table rows for every result, formatted once so paging is just slicing
+        self._result_rows = rows if rows is not None else [self._result_row(item) for item in results]
+        self.current_page = 0
+        self._recompute_pagination()
+
+    def _recompute_pagination(self):
+        """Update the result count and page count after self.results is rebound."""
+        self._results_len = len(self.results)
+        self.total_pages = (self._results_len + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE
+
+    @staticmethod
+    def _result_row(item):
+        """Build the results table row for a track."""
+        return (
+            item.get("title", "Unknown"),
+            item.get("artist", "Unknown"),
+            item.get("albumTitle", "Unknown"),
+            get_duration_str(item)
+        )
 
     def update_page(self):
         """Update the data table with the current page of results."""
-        self.table.clear(columns=True)
-        self.table.add_columns("Title", "Artist", "Album", "Duration")
+        rendered = self._rendered_page
+        if (
+            rendered is None
+            or rendered[0] is not self.results
+            or rendered[1:] != (self.current_page, self._results_len)
+        ):
+            # Columns are set up once in on_mount; only the rows change between pages
+            self.table.clear()
 
-        start_idx = self.current_page * ITEMS_PER_PAGE
-        end_idx = min(start_idx + ITEMS_PER_PAGE, len(self.results))
-
-        # Store displayed results for easy access
-        self.displayed_results = self.results[start_idx:end_idx]
-
-        for item in self.displayed_results:
-            duration = item.get("duration", 0)
-            minutes = int(duration // 60)
-            seconds = int(duration % 60)
-            duration_str = f"{minutes}:{seconds:02d}"
-            self.table.add_row(
-                item.get("title", "Unknown"),
-                item.get("artist", "Unknown"),
-                item.get("albumTitle", "Unknown"),
-                duration_str
-            )
+            start_idx = self.current_page * ITEMS_PER_PAGE
+            end_idx = min(start_idx + ITEMS_PER_PAGE, self._results_len)
 
-        # Replace the pagination_text line in update_page() method
-        view_type = "Queue" if self.viewing_queue else "Results"
-        pagination_text = f"{view_type} - Page {self.current_page + 1}/{self.total_pages} | Items {start_idx + 1}-{end_idx} of {len(self.results)}"
+            # Store displayed results for easy access
+            self.displayed_results = self.results[start_idx:end_idx]
 
-        self.pagination.update(pagination_text)
+            self.table.add_rows(self._result_rows[start_idx:end_idx])
+            self._rendered_page = (self.results, self.current_page, self._results_len)
+
+        self._update_pagination()
 
         # Reset info panel
         self.showing_info = False
         self.info.update("")
         self.info.styles.height = 1
 
+    def _update_pagination(self):
+        """Show the current page and item range below the table."""
+        start_idx = self.current_page * ITEMS_PER_PAGE
+        end_idx = min(start_idx + ITEMS_PER_PAGE, self._results_len)
+        view_type = "Queue" if self.viewing_queue else "Results"
+        if self._results_loading:
+            pages = "? (loading...)"
+        else:
+            pages = self.total_pages
+        pagination_text = f"{view_type} - Page {self.current_page + 1}/{pages} | Items {start_idx + 1}-{end_idx} of {self._results_len}"
+        self.pagination.update(pagination_text)
+
+    def _add_result_page(self, search_id, items):
+        """Show a page of search results as soon as it arrives."""
+        if search_id != self._search_id:
+            return
+        if not self._results_loading:
+            # First page: replace the old results straight away
+            self._results_loading = True
+            with self.batch_update():
+                self._set_results(items)
+                self.update_page()
+                self.set_title(f"DAB Terminal - Search: '{self.query}'")
+            return
+
+        # Later pages: rebind rather than extend, as _set_results requires
+        page_end = (self.current_page + 1) * ITEMS_PER_PAGE
+        page_was_short = self._results_len < page_end
+        self.results = self.results + items
+        self._result_rows = self._result_rows + [self._result_row(item) for item in items]
+        self._recompute_pagination()
+        if page_was_short:
+            self.update_page()
+        else:
+            self._update_pagination()
+
     def action_next_page(self):
         """Navigate to the next page of results."""
         if self.current_page < self.total_pages - 1:
@@ -413,19 +591,20 @@ class Results(App):
 
     def action_focus_next(self) -> None:
         """Toggle focus between results and queue tables."""
-        results_table = self.query_one("#results_table", DataTable)
-        queue_table = self.query_one("#queue_table", DataTable)
+        results_table = self.table
+        queue_table = self.queue_display
 
-        if self.focused == results_table:
+        if self.focused == results_table and self.show_queue:
             self.set_focus(queue_table)
         else:
             self.set_focus(results_table)
 
     def action_focus_queue(self):
-        self.set_focus(self.query_one("#queue"))
+        if self.queue_display is not None:
+            self.set_focus(self.queue_display)
 
     def action_focus_results(self):
-        self.set_focus(self.query_one("#results"))
+        self.set_focus(self.table)
 
     def action_next_track(self):
         """Play the next track in the queue."""
@@ -469,20 +648,22 @@ class Results(App):
 
         # Store original results if not already viewing queue
         if not self.viewing_queue:
-            self.original_results = self.results.copy()
+            # Kept by reference: self.results is only ever rebound, never changed in place
+            self.original_results = self.results
+            self._original_rows = self._result_rows
 
-        # Set queue tracks as current results
-        self.results = queue_tracks
-        self.viewing_queue = True
-        self.current_page = 0
-        self.total_pages = ceil(len(self.results) / ITEMS_PER_PAGE)
+        # Swap the table, footer and header in one repaint
+        with self.batch_update():
+            # Set queue tracks as current results
+            self._set_results(queue_tracks)
+            self.viewing_queue = True
 
-        # Update the display
-        self.update_page()
+            # Update the display
+            self.update_page()
 
-        # Update header to show we're viewing queue
-        header = self.query_one(Header)
-        header.text = "DAB Terminal - Queue View"
+            # Update header to show we're viewing queue
+            header = self.header
+            header.text = "DAB Terminal - Queue View"
 
         self.notify(f"Showing {len(queue_tracks)} tracks from queue", title="Queue View")
 
@@ -492,24 +673,25 @@ class Results(App):
             self.notify("Already viewing normal results", title="Results View")
             return
 
-        # Restore original results
-        if self.original_results is not None:
-            self.results = self.original_results
-            self.original_results = None
-        else:
-            # Fallback to empty results if somehow original_results is None
-            self.results = []
+        # Swap the table, footer and header in one repaint
+        with self.batch_update():
+            # Restore original results
+            if self.original_results is not None:
+                self._set_results(self.original_results, self._original_rows)
+                self.original_results = None
+                self._original_rows = None
+            else:
+                # Fallback to empty results if somehow original_results is None
+                self._set_results([])
 
-        self.viewing_queue = False
-        self.current_page = 0
-        self.total_pages = ceil(len(self.results) / ITEMS_PER_PAGE) if self.results else 0
+            self.viewing_queue = False
 
-        # Update the display
-        self.update_page()
+            # Update the display
+            self.update_page()
 
-        # Update header to show normal search results
-        header = self.query_one(Header)
-        header.text = f"DAB Terminal - Search: '{self.query}'"
+            # Update header to show normal search results
+            header = self.header
+            header.text = f"DAB Terminal - Search: '{self.query}'"
 
         self.notify("Returned to normal results view", title="Results View")
 
@@ -518,10 +700,11 @@ class Results(App):
         self.show_playlist_panel = not self.show_playlist_panel
 
         if self.show_playlist_panel:
-            self.playlist_display.styles.display = "block"
+            self._get_playlist_display().styles.display = "block"
             self.notify("Showing playlist panel", title="Playlists")
         else:
-            self.playlist_display.styles.display = "none"
+            if self.playlist_display is not None:
+                self.playlist_display.styles.display = "none"
             self.notify("Hiding playlist panel", title="Playlists")
 
     def action_quick_add_to_playlist(self):
@@ -567,8 +750,8 @@ class Results(App):
                 self.notify(f"Track not found in '{event.playlist_name}'", title="Error")
 
         # Refresh playlist display if it's visible
-        if self.show_playlist_panel:
-            self.playlist_display.refresh_playlist_list()
+        if (self.show_playlists or self.show_playlist_panel) and self.playlist_display is not None:
+            self.playlist_display.request_refresh()
 
     def action_play_selected(self):
         """Play the currently selected track."""
@@ -594,15 +777,36 @@ class Results(App):
 
     def action_toggle_queue(self):
         """Toggle the queue display visibility."""
-        queue_display = self.query_one("#queue-display")
         self.show_queue = not self.show_queue
 
-        if self.show_queue:
-            queue_display.remove_class("hidden")
-            queue_display.display = True
-        else:
-            queue_display.add_class("hidden")
-            queue_display.display = False
+    def watch_show_queue(self, show: bool) -> None:
+        if show:
+            self._get_queue_display().display = True
+        elif self.queue_display is not None:
+            self.queue_display.display = False
+
+    def watch_show_playlists(self, show: bool) -> None:
+        if show:
+            self._get_playlist_display().display = True
+        elif self.playlist_display is not None:
+            self.playlist_display.display = False
+
+    def _get_queue_display(self):
+        """Return the queue panel, mounting it hidden below the info panel on first use."""
+        if self.queue_display is None:
+            self.queue_display = QueueDisplay(self.queue_manager, id="queue-display")
+            self.queue_display.display = False
+            self.main_view.mount(self.queue_display, after=self.info)
+        return self.queue_display
+
+    def _get_playlist_display(self):
+        """Return the playlist panel, mounting it hidden below the queue panel on first use."""
+        if self.playlist_display is None:
+            self.playlist_display = PlaylistDisplay(self.playlist_manager, id="playlist-display")
+            self.playlist_display.display = False
+            anchor = self.queue_display if self.queue_display is not None else self.info
+            self.main_view.mount(self.playlist_display, after=anchor)
+        return self.playlist_display
 
     def action_add_to_queue(self):
         """Add the currently selected track to the queue."""
@@ -632,21 +836,7 @@ class Results(App):
 
     def action_stop_playback(self):
         """Stop the current playback."""
-        if self.currently_playing:
-            self.player.stop()
-            self.currently_playing = None
-            self.is_paused = False
-            self.now_playing.update("Not Playing")
-
-            # Update progress bar
-            progress_bar = self.query_one("#progress_bar", Static)
-            progress_bar.update("▕░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░▏ 0:00 / 0:00 (Not Playing)")
-
-            self.notify("Playback stopped", title="Playback")
-
-        # Hide lyrics display if showing
-        if self.lyrics_display and self.lyrics_display.styles.display != "none":
-            self.lyrics_display.styles.display = "none"
+        self._do_stop(reset_bar=True, hide_lyrics=True)
 
     def get_current_playback_position(self):
         """Return current playback time in seconds from player."""
@@ -654,21 +844,45 @@ class Results(App):
 
     def action_fast_forward(self):
         """Fast forward 5 seconds."""
-        if self.player.is_playing:
-            current_time = self.player.player.get_time()
-            new_time = current_time + 5000  # 5 seconds
-            duration = self.player.player.get_length()
-            if new_time < duration:
-                self.player.player.set_time(new_time)
-                self.notify("Fast forwarded 5 seconds", title="Seek")
+        self._queue_seek(5000)
 
     def action_rewind(self):
         """Rewind 5 seconds."""
-        if self.player.is_playing:
-            current_time = self.player.player.get_time()
-            new_time = max(0, current_time - 5000)
+        self._queue_seek(-5000)
+
+    def _queue_seek(self, delta_ms: int):
+        """Add to the pending seek, which is applied at most every 50 ms."""
+        if not self.player.is_playing:
+            return
+        self._pending_seek_ms += delta_ms
+        if self._seek_timer is None:
+            self._seek_timer = self.set_timer(0.05, self._flush_seek)
+
+    def _flush_seek(self):
+        """Apply the accumulated seek with one read and one write to VLC."""
+        self._seek_timer = None
+        delta_ms = self._pending_seek_ms
+        self._pending_seek_ms = 0
+        if not delta_ms or not self.player.is_playing:
+            return
+
+        current_time = self.player.player.get_time()
+        seconds = abs(delta_ms) // 1000
+        if delta_ms > 0:
+            new_time = current_time + delta_ms
+            duration = self.player.player.get_length()
+            if new_time < duration:
+                self.player.player.set_time(new_time)
+                self.notify(f"Fast forwarded {seconds} seconds", title="Seek")
+        else:
+            new_time = max(0, current_time + delta_ms)
             self.player.player.set_time(new_time)
-            self.notify("Rewound 5 seconds", title="Seek")
+            self.notify(f"Rewound {seconds} seconds", title="Seek")
+
+    async def action_clear_cache(self):
+        """Drop cached searches, stream URLs, track details and lyrics."""
+        await asyncio.get_event_loop().run_in_executor(self._io_executor, clear_caches)
+        self.notify("Cache cleared", title="Cache")
 
     def action_toggle_repeat(self):
         """Toggle repeat mode."""
@@ -689,6 +903,17 @@ class Results(App):
             self.set_focus(self.table)
 
     def action_submit_search(self):
+        """Search for the input's text once submissions have settled for 200 ms."""
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(0.2, self._start_search)
+
+    def _start_search(self):
+        """Run the search in a worker, replacing one still in progress."""
+        self._search_timer = None
+        self.run_worker(self._submit_search(), group="search", exclusive=True)
+
+    async def _submit_search(self):
         """Process the search input and fetch results."""
         query = self.search_input.value.strip()
         if not query:
@@ -704,34 +929,48 @@ class Results(App):
         # Show loading indicator
         self.pagination.update("Searching...")
 
-        def do_search():
-            """Background thread to perform search"""
-            new_results = fetch_all_results(query, self.search_type)
-            if not new_results:
-                self.call_from_thread(lambda: self.notify("No results found", title="Search"))
-                self.call_from_thread(lambda: self.pagination.update("No results found"))
-                return
+        self._search_id += 1
+        search_id = self._search_id
+        self._results_loading = False
 
-            def update_ui():
-                self.results = new_results
-                self.current_page = 0
-                self.total_pages = ceil(len(self.results) / ITEMS_PER_PAGE)
-                self.update_page()
-                self.set_title(f"DAB Terminal - Search: '{self.query}'")
+        def on_page(items):
+            # Runs on the fetch thread; each page is shown while the rest load
+            self.call_from_thread(self._add_result_page, search_id, items)
 
-            self.call_from_thread(update_ui)
+        try:
+            new_results = await asyncio.get_event_loop().run_in_executor(
+                self._io_executor, fetch_all_results, query, self.search_type, on_page
+            )
+        except asyncio.CancelledError:
+            # Leave the flag alone if a newer search already owns it
+            if search_id == self._search_id:
+                self._results_loading = False
+            raise
+        streamed = self._results_loading
+        self._results_loading = False
+
+        if not new_results:
+            self.notify("No results found", title="Search")
+            self.pagination.update("No results found")
+            return
 
-        threading.Thread(target=do_search, daemon=True).start()
+        if streamed:
+            # Every page is already shown; only the page count was pending
+            self._update_pagination()
+        else:
+            # Served from the cache in one piece
+            with self.batch_update():
+                self._set_results(new_results)
+                self.update_page()
+                self.set_title(f"DAB Terminal - Search: '{self.query}'")
 
     async def action_toggle_keybinds(self):
         """Toggle visibility of the keybinds help screen."""
-        if not hasattr(self, "keybinds_display") or self.keybinds_display is None:
-            self.keybinds_display = self.query_one("#keybinds_display", Static)
-            if not self.keybinds_display:
-                self.notify("Keybinds display not available", title="Error")
-                return
-
-        if self.keybinds_display.styles.display == "none":
+        if self.keybinds_display is None:
+            self.keybinds_display = KeybindsDisplay(id="keybinds_display")
+            await self.main_view.mount(self.keybinds_display, after=self.search_input)
+            self.notify("Showing keybindings", title="Help")
+        elif self.keybinds_display.styles.display == "none":
             self.keybinds_display.styles.display = "block"
             self.notify("Showing keybindings", title="Help")
         else:
@@ -740,15 +979,7 @@ class Results(App):
 
     def action_toggle_playlists(self):
         """Toggle the playlist display visibility."""
-        playlist_display = self.query_one("#playlist-display")
         self.show_playlists = not self.show_playlists
-
-        if self.show_playlists:
-            playlist_display.remove_class("hidden")
-            playlist_display.display = True
-        else:
-            playlist_display.add_class("hidden")
-            playlist_display.display = False
     # Add this method to your Results class in results.py
 
     def action_play_playlist(self):
@@ -759,9 +990,6 @@ class Results(App):
             self.notify("No playlists found. Create a playlist first.", title="Play Playlist")
             # Optionally show the playlist panel to create one
             self.show_playlists = True
-            playlist_display = self.query_one("#playlist-display")
-            playlist_display.remove_class("hidden")
-            playlist_display.display = True
             return
 
         # If there's only one playlist, play it directly
@@ -772,9 +1000,6 @@ class Results(App):
         # Show playlist selection (you might want to implement a proper selection UI)
         # For now, let's show the playlist panel and notify the user
         self.show_playlists = True
-        playlist_display = self.query_one("#playlist-display")
-        playlist_display.remove_class("hidden")
-        playlist_display.display = True
 
         # Create a formatted list of playlists for notification
         playlist_list = "\n".join([f"{i+1}. {name} ({len(self.playlist_manager.get_playlist(name))} tracks)"
@@ -801,8 +1026,7 @@ class Results(App):
         # Clear current queue and add all playlist tracks
         self.queue_manager.clear_queue()
 
-        for track in playlist_tracks:
-            self.queue_manager.add_track(track)
+        self.queue_manager.add_tracks(playlist_tracks)
 
         # Start playing the first track
         first_track = self.queue_manager.next_track()
@@ -823,16 +1047,14 @@ class Results(App):
         track_to_add = self.currently_playing or selected_track
         playlists = self.playlist_manager.get_playlists()
 
-        playlist_display = self.query_one("#playlist-display")
+        playlist_display = self._get_playlist_display()
 
         if not playlists:
             self.notify("No playlists available. Create one first.")
             self.show_playlists = True
-            playlist_display.remove_class("hidden")
 
-            # Show the new playlist creation form automatically
-            playlist_display.query_one("#new-playlist-area").remove_class("hidden")
-            playlist_display.query_one("#new-playlist-input").focus()
+            # Put the cursor in the new playlist form once the panel has been composed
+            self.call_after_refresh(lambda: playlist_display.new_playlist_input.focus())
 
             return
 
@@ -843,26 +1065,7 @@ class Results(App):
         else:
             self.notify("Failed to add track to playlist")
 
-    def on_playlist_selected(self, event: PlaylistSelectorModal):
-        selected_track = self.get_selected_track()
-        if not selected_track:
-            self.notify("No track selected")
-            return
-
-        track_to_add = self.currently_playing or selected_track
-        playlist_name = event.playlist
-
-        playlist_display = self.query_one("#playlist-display")
-        if playlist_display.add_current_track_to_playlist(track_to_add, playlist_name):
-            self.notify(f"Added '{track_to_add.get('title', 'Unknown')}' to playlist '{playlist_name}'")
-        else:
-            self.notify("Failed to add track to playlist")
-
-        # Optionally hide the selector again
-        self.show_playlists = False
-        playlist_display.add_class("hidden")
-
-    async def action_download_hovered_track(self):
+    def action_download_hovered_track(self):
         """Download the hovered track from results table."""
         if not self.table or not self.results:
             self.notify("No table or results loaded", title="Error")
@@ -890,28 +1093,27 @@ class Results(App):
         # Notify that download has started
         self.notify(f"Downloading {title}...", title="Download", timeout=3)
 
+        # Downloads run in the background so the UI keeps taking keys meanwhile
+        self.run_worker(self._download_track(track_id, title, was_playing), group="download")
+
+    async def _download_track(self, track_id, title, was_playing):
+        """Download a track off the event loop and report how it went."""
         def on_download_complete():
             self.notify(f"✅ Download complete: {title}", title="Finished", timeout=5)
             if was_playing:
                 self.player.resume()
 
-        def background_download():
-            try:
-                file_path = download_track(track_id)
-                if not file_path:
-                    raise ValueError("Failed to get streaming URL")
-
-                # Wait for the file to be fully written
-                while not os.path.exists(file_path) or os.path.getsize(file_path) < 10000:
-                    time.sleep(0.2)
-
-                on_download_complete()
-            except Exception as e:
-                self.notify(f"❌ Download failed: {e}", title="Error", timeout=5)
-                if was_playing:
-                    self.player.resume()
-
-        threading.Thread(target=background_download, daemon=True).start()
+        try:
+            # Returns once the file is fully written
+            file_path = await _run_in_daemon_thread(download_track, track_id)
+            if not file_path:
+                raise ValueError("Could not fetch the track")
+
+            on_download_complete()
+        except Exception as e:
+            self.notify(f"❌ Download failed: {e}", title="Error", timeout=5)
+            if was_playing:
+                self.player.resume()
 
     def format_track_info(self, track):
         """Format track details into a rich table."""
@@ -921,10 +1123,7 @@ class Results(App):
             if detailed_info:
                 track.update(detailed_info)
 
-        duration = track.get("duration", 0)
-        minutes = int(duration // 60)
-        seconds = int(duration % 60)
-        duration_str = f"{minutes}:{seconds:02d}"
+        duration_str = get_duration_str(track)
 
         # Extract audio details
         bit_depth = track.get("audioQuality", {}).get("maximumBitDepth", 0)
@@ -973,52 +1172,78 @@ class Results(App):
                 self.info.update("Loading track details...")
                 self.info.styles.height = "auto"
 
-                # Fetch detailed track info in background thread to avoid UI freezing
-                def fetch_and_display_info():
-                    track_info_table = self.format_track_info(track)
-                    track_info_panel = Panel(
-                        track_info_table,
-                        title=f"Track Info: {track.get('title', 'Unknown')}",
-                        border_style="green"
-                    )
-
-                    # Update UI from main thread
-                    self.call_from_thread(lambda: self.info.update(track_info_panel))
-
-                threading.Thread(target=fetch_and_display_info, daemon=True).start()
+                # Fetch detailed track info in the background to avoid UI freezing
+                self.run_worker(self._show_track_info(track), group="track-info", exclusive=True)
             else:
+                self.workers.cancel_group(self, "track-info")
                 self.info.update("")  # Clear the panel content
                 self.info.styles.height = 1
 
-    def action_toggle_lyrics(self):
+    async def _show_track_info(self, track):
+        """Fetch a track's details off the event loop and show them in the info panel."""
+        track_info_table = await asyncio.get_event_loop().run_in_executor(
+            self._io_executor, self.format_track_info, track
+        )
+        if not self.showing_info:
+            # Hidden again while the details were loading
+            return
+        track_info_panel = Panel(
+            track_info_table,
+            title=f"Track Info: {track.get('title', 'Unknown')}",
+            border_style="green"
+        )
+        self.info.update(track_info_panel)
+
+    @property
+    def lyrics_visible(self):
+        """Whether the lyrics display has been created and is showing."""
+        return self.lyrics_display is not None and self.lyrics_display.styles.display != "none"
+
+    async def action_toggle_lyrics(self):
         """Toggle the visibility of lyrics display."""
-        if not hasattr(self, 'lyrics_display') or self.lyrics_display is None:
-            self.lyrics_display = self.query_one("#lyrics_display")
-            if not self.lyrics_display:
-                self.notify("Lyrics display not available", title="Error")
-                return
+        await self.show_lyrics(not self.lyrics_visible)
 
-        if not isinstance(self.lyrics_display, LyricsDisplay):
-            old_display = self.lyrics_display
-            self.lyrics_display = LyricsDisplay(id="lyrics_display_new")
-            if old_display.parent:
-                old_display.parent.mount(self.lyrics_display, before=old_display)
-                old_display.remove()
-            self.lyrics_display.styles.display = "none"
-
-        if self.lyrics_display.styles.display == "none":
-            if self.currently_playing:
-                self.lyrics_display.styles.display = "block"
-                artist = self.currently_playing.get("artist", "")
-                title = self.currently_playing.get("title", "")
-
-                # Fetch lyrics (sync highlighting is handled via update_position elsewhere)
-                self.lyrics_display.fetch_lyrics(artist, title)
-                self.notify("Showing lyrics", title="Lyrics")
-            else:
+    async def show_lyrics(self, value: bool, *, notify: bool = True):
+        """
+        Show lyrics for the current track, or hide them.
+
+        Args:
+            value: True to show the lyrics display, False to hide it
+            notify: Announce the change; programmatic changes pass False
+        """
+        if not value:
+            self._hide_lyrics(notify=notify)
+            return
+
+        if not self.currently_playing:
+            if notify:
                 self.notify("No track currently playing", title="Lyrics")
+            return
+
+        artist, title = self.current_track_key
+        if not artist or not title:
+            if notify:
+                self.notify("Missing artist or title metadata", title="Lyrics")
+            return
+
+        if self.lyrics_display is None:
+            self.lyrics_display = LyricsDisplay(id="lyrics_display")
+            await self.main_view.mount(self.lyrics_display, after=self.now_playing)
         else:
-            self.lyrics_display.styles.display = "none"
+            self.lyrics_display.styles.display = "block"
+
+        # Fetch lyrics (sync highlighting is handled via update_position elsewhere)
+        self._fetch_lyrics(self.current_track_key)
+        if notify:
+            self.notify("Showing lyrics", title="Lyrics")
+
+    def _hide_lyrics(self, *, notify: bool = True):
+        """Hide the lyrics display, if shown, and drop any fetch in flight."""
+        self._cancel_lyrics_fetch()
+        if not self.lyrics_visible:
+            return
+        self.lyrics_display.styles.display = "none"
+        if notify:
             self.notify("Hiding lyrics", title="Lyrics")
 
     def on_input_submitted(self, event):
@@ -1026,9 +1251,30 @@ class Results(App):
         if event.input.id == "search_input":
             self.action_submit_search()
 
-    def on_unmount(self):
+    async def on_unmount(self):
         """Clean up resources when the app is closing."""
-        self.player.stop()
+        self._cancel_lyrics_fetch()
+        for group in ("lyrics-prefetch", "search", "playback", "download", "track-info"):
+            self.workers.cancel_group(self, group)
+
+        # Stopping can wait on VLC and the position thread; don't let that hold up exit
+        try:
+            await asyncio.wait_for(
+                asyncio.get_event_loop().run_in_executor(None, self.player.stop), timeout=0.5
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Player did not stop within 0.5s; exiting anyway")
+
+        await self.playlist_manager.aflush()
+        # Jobs already running are still joined at interpreter exit; these are short
+        # API calls bounded by REQUEST_TIMEOUT, so only drop the ones still queued
+        for executor in (self._io_executor, self._player_executor):
+            try:
+                executor.shutdown(wait=False, cancel_futures=True)
+            except TypeError:
+                # cancel_futures is new in Python 3.9
+                executor.shutdown(wait=False)
+        close_disk_cache()
 
     def action_quit(self):
         """Exit the application."""
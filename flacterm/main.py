@@ -6,6 +6,11 @@ A terminal-based music player using the DAB API and Textual TUI framework.
 
 import sys
 import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Input, Button, Static, Select, Label
@@ -297,7 +302,14 @@ class DABMusicPlayerApp(App):
             new_search_app.run()
 
 
+def install_event_loop_policy():
+    """Run the apps on uvloop when it is available, falling back to stdlib asyncio."""
+    if uvloop is not None and sys.platform != "win32":
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main():
+    install_event_loop_policy()
     try:
         while True:
             app = DABMusicPlayerApp()
@@ -2,12 +2,22 @@
 API utilities for interacting with the music service.
 """
 import requests
+from requests.adapters import HTTPAdapter
 import base64
+import functools
 import os
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlencode, quote
 from ..config import _ENCODED_API, console
 
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
 DOWNLOAD_DIR = "YourDownloads"
 os.makedirs(DOWNLOAD_DIR, exist_ok=True)
 
@@ -25,6 +35,144 @@ HEADERS = {
     'Priority': 'u=0, i'
 }
 
+# Bytes read and written per step when downloading; FLAC files run to tens of MB
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Search result pages requested at once after the first page
+SEARCH_PAGE_WORKERS = 4
+
+# Stream URLs are signed and eventually expire, so they are only reused briefly
+STREAM_URL_TTL = 600
+
+# Search results and track details are kept on disk for a day between sessions
+CACHE_DIR = os.path.expanduser("~/.cache/flacterm")
+PERSISTED_CACHE_TTL = 86400
+
+# Seconds to wait on an API response; also bounds how long quitting waits on one
+REQUEST_TIMEOUT = 15
+
+# Connections kept open per host; covers the I/O pool, page fetches and a download
+HTTP_POOL_SIZE = 16
+
+# Shared by every request so repeat calls skip the TCP and TLS handshakes
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE))
+_session.mount("http://", HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE))
+
+_disk_cache = None
+_disk_cache_lock = threading.Lock()
+
+# (cache, lock) of every memoized function, for clear_caches()
+_memo_caches = []
+
+
+def _get_disk_cache():
+    """Open the on-disk cache on first use, or return None if it is unavailable."""
+    global _disk_cache
+    if diskcache is None:
+        return None
+    with _disk_cache_lock:
+        if _disk_cache is None:
+            try:
+                _disk_cache = diskcache.Cache(CACHE_DIR)
+            except Exception as e:
+                console.print(f"[red]Could not open cache[/red]: {e}")
+                return None
+    return _disk_cache
+
+
+def close_disk_cache():
+    """Close the on-disk cache if it was opened."""
+    global _disk_cache
+    with _disk_cache_lock:
+        if _disk_cache is not None:
+            _disk_cache.close()
+            _disk_cache = None
+
+
+def clear_caches():
+    """Forget every memoized result, in memory and on disk."""
+    for cache, lock in _memo_caches:
+        with lock:
+            cache.clear()
+    disk_cache = _get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.clear()
+
+
+def memoize(maxsize=256, ttl=None, key=None, persist=False, persist_ttl=PERSISTED_CACHE_TTL,
+            stale_while_revalidate=False, cache_if=bool):
+    """
+    Cache a function's results in memory, evicting the least recently used.
+
+    Falsy results (failed requests) are not cached, so they are retried on
+    the next call. cache_if can narrow that further.
+
+    Args:
+        maxsize: Maximum number of cached results
+        ttl: Seconds a result stays valid, or None to keep it until evicted
+        key: Function mapping the call's arguments to a cache key
+        persist: Also keep results on disk when diskcache is installed
+        persist_ttl: Seconds a result stays valid on disk
+        stale_while_revalidate: Return an expired result straight away and
+            refresh it on a background thread, instead of waiting on the call
+        cache_if: Predicate deciding whether a result is worth caching
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        # Keys with a background refresh running, so each is refreshed once
+        refreshing = set()
+
+        def store(cache_key, result, disk_cache):
+            if disk_cache is not None:
+                disk_cache.set((func.__name__, cache_key), result, expire=persist_ttl)
+            with lock:
+                cache[cache_key] = (result, time.monotonic())
+                cache.move_to_end(cache_key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+        def refresh(cache_key, args):
+            try:
+                result = func(*args)
+                if cache_if(result):
+                    store(cache_key, result, _get_disk_cache() if persist else None)
+            except Exception as e:
+                console.print(f"[red]Cache refresh failed[/red]: {e}")
+            finally:
+                with lock:
+                    refreshing.discard(cache_key)
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            cache_key = key(*args) if key else args
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(cache_key)
+                if entry is not None:
+                    fresh = ttl is None or now - entry[1] < ttl
+                    if fresh or stale_while_revalidate:
+                        cache.move_to_end(cache_key)
+                        if not fresh and cache_key not in refreshing:
+                            refreshing.add(cache_key)
+                            threading.Thread(target=refresh, args=(cache_key, args), daemon=True).start()
+                        return entry[0]
+            disk_cache = _get_disk_cache() if persist else None
+            result = disk_cache.get((func.__name__, cache_key)) if disk_cache is not None else None
+            if result is not None:
+                store(cache_key, result, None)
+                return result
+            result = func(*args)
+            if cache_if(result):
+                store(cache_key, result, disk_cache)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        _memo_caches.append((cache, lock))
+        return wrapper
+    return decorator
+
 def get_base_url():
     """Decode and return the base API URL."""
     return base64.b64decode(_ENCODED_API).decode('utf-8')
@@ -45,43 +193,64 @@ def search_dab(query: str, search_type: str = "track", offset: int = 0):
     params = {"q": query, "offset": offset, "type": search_type}
     full_url = f"{base_url}/search?{urlencode(params)}"
     try:
-        response = requests.get(full_url)
+        response = _session.get(full_url, timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
             return response.json()
     except Exception as e:
         console.print(f"[red]Request failed[/red]: {e}")
     return None
 
-def fetch_all_results(query, search_type):
+class PartialResults(list):
+    """Search results cut short by a failed page request; never cached."""
+
+
+@memoize(
+    maxsize=64,
+    key=lambda query, search_type, on_page=None: (query.lower().strip(), search_type),
+    persist=True,
+    cache_if=lambda results: bool(results) and not isinstance(results, PartialResults),
+)
+def fetch_all_results(query, search_type, on_page=None):
     """
     Fetch all pages of search results.
 
     Args:
         query: Search query string
         search_type: Type of search ("track" or "album")
+        on_page: Called with each page's items, in order, as they arrive (optional).
+            Not called when the results come from the cache.
 
     Returns:
-        List of all items from all pages
+        List of all items from all pages, or a PartialResults list holding the
+        pages before one that failed
     """
-    all_items = []
-    offset = 0
-    while True:
-        data = search_dab(query, search_type, offset=offset)
-        if not data:
-            break
-        key = "tracks" if search_type == "track" else "albums"
-        items = data.get(key, [])
-        pagination = data.get("pagination", {})
-        if not items:
-            break
-        all_items.extend(items)
-        total = pagination.get("total", 0)
-        limit = pagination.get("limit", len(items))
-        offset += limit
-        if offset >= total:
-            break
+    key = "tracks" if search_type == "track" else "albums"
+    data = search_dab(query, search_type)
+    items = data.get(key, []) if data else []
+    if not items:
+        return []
+    all_items = list(items)
+    if on_page:
+        on_page(items)
+
+    # The first page gives the total, so the rest can be requested together
+    pagination = data.get("pagination", {})
+    limit = pagination.get("limit") or len(items)
+    offsets = range(limit, pagination.get("total", 0), limit)
+    if offsets:
+        with ThreadPoolExecutor(max_workers=min(SEARCH_PAGE_WORKERS, len(offsets))) as pool:
+            pages = pool.map(lambda offset: search_dab(query, search_type, offset=offset), offsets)
+            for data in pages:
+                items = data.get(key, []) if data else []
+                if not items:
+                    # Keep what arrived, but retry the whole search next time
+                    return PartialResults(all_items)
+                all_items.extend(items)
+                if on_page:
+                    on_page(items)
     return all_items
 
+@memoize(maxsize=256, ttl=STREAM_URL_TTL)
 def get_streaming_url(track_id):
     """
     Get the streaming URL for a track.
@@ -95,13 +264,14 @@ def get_streaming_url(track_id):
     base_url = get_base_url()
     url = f"{base_url}/stream?trackId={track_id}"
     try:
-        response = requests.get(url)
+        response = _session.get(url, timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
             return response.json().get("url")
     except Exception as e:
         console.print(f"[red]Failed to get streaming URL[/red]: {e}")
     return None
 
+@memoize(maxsize=256, persist=True)
 def get_track_detail(track_id):
     """
     Get detailed information for a track.
@@ -115,7 +285,7 @@ def get_track_detail(track_id):
     base_url = get_base_url()
     url = f"{base_url}/track/{track_id}"
     try:
-        response = requests.get(url)
+        response = _session.get(url, timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
             return response.json()
     except Exception as e:
@@ -123,28 +293,38 @@ def get_track_detail(track_id):
     return None
 
 def _download_worker(url: str, filename: str):
-    """Worker function to download a file in the background."""
+    """
+    Download a file into DOWNLOAD_DIR.
+
+    Returns:
+        Path of the file once it is completely written, or None if the download failed
+    """
+    file_path = os.path.join(DOWNLOAD_DIR, filename)
     try:
-        with requests.get(url, headers=HEADERS, stream=True, timeout=30) as r:
+        with _session.get(url, headers=HEADERS, stream=True, timeout=30) as r:
             r.raise_for_status()
-            file_path = os.path.join(DOWNLOAD_DIR, filename)
             with open(file_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if chunk:
                         f.write(chunk)
-        console.print(f"[green]Download complete:[/green] {file_path}")
+                f.flush()
+                os.fsync(f.fileno())
     except Exception as e:
         console.print(f"[red]Download failed[/red]: {e}")
+        return None
+    return file_path
 
 def download_track(track_id: str) -> str:
-    """Get the stream URL and download it in background."""
+    """
+    Download a track, blocking until it is on disk.
+
+    Call this from a worker thread.
+
+    Returns:
+        Path of the downloaded file, or None if the download failed
+    """
     stream_url = get_streaming_url(track_id)
     if not stream_url:
         return None
 
-    filename = f"{track_id}.flac"
-
-    thread = threading.Thread(target=_download_worker, args=(stream_url, filename), daemon=True)
-    thread.start()
-
-    return os.path.join(DOWNLOAD_DIR, filename)
+    return _download_worker(stream_url, f"{track_id}.flac")
@@ -30,6 +30,9 @@ setup(
         'flacterm': ['*.txt', '*.md', '*.json'],
     },
     install_requires=requirements,
+    extras_require={
+        'fast': ['uvloop; sys_platform != "win32"'],
+    },
     python_requires='>=3.8',
     entry_points={
         'console_scripts': [